@@ -10,7 +10,7 @@ import abc
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Optional, Union
+from typing import Any, Dict, Generator, List, NamedTuple, Optional, Union
 
 
 class DataSourceType(Enum):
@@ -31,15 +31,27 @@ class DataSourceConfig:
     metadata: Dict[str, Any] = None
 
 
-@dataclass
-class Document:
-    """Represents a single document extracted from a data source."""
+class Document(NamedTuple):
+    """Represents a single document extracted from a data source.
+    
+    Documents are never modified after collection, so they are immutable
+    named tuples: cheap to construct, and convertible to and from plain
+    tuples with Document._make() and tuple().
+    """
     id: str
     text: str
     metadata: Dict[str, Any]
     source: str
     source_id: str
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the document to a dictionary.
+        
+        Returns:
+            Dict[str, Any]: Dictionary representation of the document.
+        """
+        return self._asdict()
+    
 
 class DataCollector(abc.ABC):
     """Abstract base class for all data collectors."""
@@ -17,6 +17,12 @@ import lzma
 import pandas as pd
 import requests
 
+# orjson is optional and only used to parse JSONL lines faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .base import DataCollector, DataSourceConfig, Document
 
 
@@ -242,16 +248,24 @@ class JSONLCollector(DataCollector):
         else:
             open_func = open
         
+        # orjson parses raw bytes, which also skips decoding each line
+        if orjson is not None:
+            open_args = {"mode": "rb"}
+            loads = orjson.loads
+        else:
+            open_args = {"mode": "rt", "encoding": "utf-8"}
+            loads = json.loads
+            
         try:
-            with open_func(self.config.local_path, 'rt', encoding='utf-8') as f:
+            with open_func(self.config.local_path, **open_args) as f:
                 for line in f:
                     # Skip empty lines
                     if not line.strip():
                         continue
                         
                     try:
-                        # Parse JSON
-                        data = json.loads(line)
+                        # Parse JSON (orjson errors subclass json.JSONDecodeError)
+                        data = loads(line)
                         
                         # Skip entries without text
                         if text_field not in data or not data[text_field]:
@@ -8,7 +8,7 @@ import logging
 from pathlib import Path
 from typing import Dict, Generator, List, Optional, Union
 
-from .base import DataCollector, DataSourceConfig, DataSourceType, Document
+from .base import DataCollector, DataCollectorFactory, DataSourceConfig, DataSourceType, Document
 from .court_listener import CourtListenerCollector
 from .pile_of_law import PileOfLawCollector
 from .generic import CSVCollector, JSONLCollector
@@ -59,7 +59,6 @@ def create_collector(
     )
     
     # Create collector using factory
-    from .base import DataCollectorFactory
     return DataCollectorFactory.create_collector(config)
 
 
@@ -9,7 +9,7 @@ different processing strategies.
 import abc
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, Generator, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Generator, Iterator, List, Mapping, Optional, Set, Tuple, Union
 
 # Import Document class from data collection module
 from ..data_collection.base import Document
@@ -75,6 +75,59 @@ class ProcessedDocument:
             processing_history=["initial_import"]
         )
     
+    @classmethod
+    def from_mongo(cls, doc_dict: Mapping[str, Any]) -> 'ProcessedDocument':
+        """Create a ProcessedDocument from a MongoDB document.
+        
+        Bypasses __init__ and assigns all fields in one __dict__ update,
+        since documents loaded from storage don't need default handling
+        beyond filling in missing fields.
+        
+        Args:
+            doc_dict: Document as stored in MongoDB.
+            
+        Returns:
+            ProcessedDocument: The stored document.
+        """
+        doc = cls.__new__(cls)
+        doc.__dict__.update({
+            "id": doc_dict["id"],
+            "source": doc_dict["source"],
+            "source_id": doc_dict["source_id"],
+            "text": doc_dict["text"],
+            "tokens": doc_dict.get("tokens"),
+            "token_count": doc_dict.get("token_count"),
+            "quality_score": doc_dict.get("quality_score"),
+            "quality_metrics": doc_dict.get("quality_metrics") or {},
+            "processing_metadata": doc_dict.get("metadata") or {},
+            "original_metadata": doc_dict.get("original_metadata") or {},
+            "enhanced_metadata": doc_dict.get("enhanced_metadata") or {},
+            "processing_history": doc_dict.get("processing_history") or []
+        })
+        
+        return doc
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the processed document to a dictionary.
+        
+        Returns:
+            Dict[str, Any]: Dictionary representation of the document.
+        """
+        return {
+            "id": self.id,
+            "text": self.text,
+            "tokens": self.tokens,
+            "token_count": self.token_count,
+            "quality_score": self.quality_score,
+            "quality_metrics": self.quality_metrics,
+            "source": self.source,
+            "source_id": self.source_id,
+            "original_metadata": self.original_metadata,
+            "enhanced_metadata": self.enhanced_metadata,
+            "processing_history": self.processing_history,
+            "processing_metadata": self.processing_metadata
+        }
+    
     def add_processing_step(self, step_name: str, metadata: Optional[Dict[str, Any]] = None) -> None:
         """Record a processing step in the document's history.
         
@@ -102,6 +155,22 @@ class Processor(abc.ABC):
         """
         pass
     
+    def stream(self, document: Union[Document, ProcessedDocument]) -> Iterator[Any]:
+        """Process a single document incrementally.
+        
+        Processors that produce many intermediate items (sentences, tokens)
+        override this to yield them one at a time, so a downstream processor
+        can consume them without the full intermediate list in memory. The
+        default implementation yields the result of process().
+        
+        Args:
+            document: Document to process.
+            
+        Yields:
+            Any: Processing results, one at a time.
+        """
+        return iter([self.process(document)])
+    
     @abc.abstractmethod
     def get_stage(self) -> ProcessingStage:
         """Get the processing stage this processor belongs to.
@@ -15,6 +15,13 @@ from .base import Processor, ProcessedDocument, ProcessingStage
 
 logger = logging.getLogger(__name__)
 
+# Citation normalization patterns, compiled once per process rather than
+# looked up in the re module's cache for every document
+_CASE_NAME_V_PATTERN = re.compile(r'(?<=\w)\s+v\.\s+(?=\w)')
+_US_REPORTS_PATTERN = re.compile(r'(\d+)\s*U\.S\.\s*(\d+)')
+_SUPREME_COURT_REPORTER_PATTERN = re.compile(r'(\d+)\s*S\.\s*Ct\.\s*(\d+)')
+_FEDERAL_REPORTER_PATTERN = re.compile(r'(\d+)\s*F\.\s*(\d+)\s*(\d+)')
+
 
 class BasicTextCleaner(Processor):
     """Basic text cleaner for common text normalization tasks."""
@@ -239,12 +246,12 @@ class LegalTextCleaner(Processor):
         if self.normalize_citations:
             # This is a simplified approach; real citation normalization would be more complex
             # Normalize "v." in case names
-            text = re.sub(r'(?<=\w)\s+v\.\s+(?=\w)', ' v. ', text)
+            text = _CASE_NAME_V_PATTERN.sub(' v. ', text)
             
             # Normalize common citation formats
-            text = re.sub(r'(\d+)\s*U\.S\.\s*(\d+)', r'\1 U.S. \2', text)
-            text = re.sub(r'(\d+)\s*S\.\s*Ct\.\s*(\d+)', r'\1 S. Ct. \2', text)
-            text = re.sub(r'(\d+)\s*F\.\s*(\d+)\s*(\d+)', r'\1 F.\2d \3', text)
+            text = _US_REPORTS_PATTERN.sub(r'\1 U.S. \2', text)
+            text = _SUPREME_COURT_REPORTER_PATTERN.sub(r'\1 S. Ct. \2', text)
+            text = _FEDERAL_REPORTER_PATTERN.sub(r'\1 F.\2d \3', text)
             
         # Update the document
         document.text = text
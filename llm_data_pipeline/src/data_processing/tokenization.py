@@ -7,9 +7,12 @@ legal text and preparing data for language model training.
 
 import re
 import logging
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 import nltk
 from nltk.tokenize import sent_tokenize as nltk_sent_tokenize, word_tokenize as nltk_word_tokenize
+from nltk.tokenize.punkt import PunktTokenizer
 
 def sent_tokenize(text, language='english'):
     """
@@ -20,19 +23,41 @@ def sent_tokenize(text, language='english'):
         return nltk_sent_tokenize(text, language=language)
     except LookupError:
         # Simple fallback using regex
-        import re
         return re.split(r'(?<=[.!?])\s+', text)
 
+@lru_cache(maxsize=None)
+def _get_punkt_tokenizer(language):
+    """Load the Punkt sentence tokenizer for a language once per process."""
+    return PunktTokenizer(language)
+
+def iter_sentences(text, language='english'):
+    """
+    Lazily yield sentences using Punkt's span tokenizer.
+    Falls back to the regex-based splitter used by sent_tokenize if the
+    Punkt model is unavailable.
+    """
+    try:
+        tokenizer = _get_punkt_tokenizer(language)
+    except LookupError:
+        start = 0
+        for match in re.finditer(r'(?<=[.!?])\s+', text):
+            yield text[start:match.start()]
+            start = match.end()
+        yield text[start:]
+        return
+    
+    for start, end in tokenizer.span_tokenize(text):
+        yield text[start:end]
+
 def word_tokenize(text, language='english', preserve_line=False):
     """
     Wrapper for NLTK's word_tokenize that handles the punkt_tab error.
     Falls back to a simple regex-based tokenizer if NLTK's tokenizer fails.
     """
     try:
-        return nltk_word_tokenize(text, language=language)
+        return nltk_word_tokenize(text, language=language, preserve_line=preserve_line)
     except LookupError:
         # Simple fallback using regex
-        import re
         # First split into sentences if not preserving lines
         if not preserve_line:
             sentences = sent_tokenize(text, language=language)
@@ -52,6 +77,34 @@ from .base import Processor, ProcessedDocument, ProcessingStage
 
 logger = logging.getLogger(__name__)
 
+# Private-use character used to mark sentence boundaries when sentences are
+# joined for batch word tokenization
+_SENTENCE_SENTINEL = "\uE000"
+
+# NLTK's word tokenizer applies a few rules only at the very start or end of
+# its input, so sentences joined for batch tokenization get them applied
+# beforehand: the opening double quote rule and the final period rule. The
+# latter stops at a quote after a space (NLTK has made it an opening quote by
+# then) and keeps closing quotes next to the period, so they aren't read as
+# opening quotes either
+_SENTENCE_INITIAL_QUOTE = re.compile(r'^"')
+_SENTENCE_FINAL_PERIOD = re.compile(r'([^\.])(\.)((?:[\]\)}>"\'»”’]| (?!"|\'\'))*)\s*$')
+
+# Compiled once per process rather than per tokenizer instance
+_PUNCTUATION_PATTERN = re.compile(r'^\W+$')
+_CITATION_PATTERN = re.compile(
+    r'\d+\s+(?:U\.S\.|S\.\s*Ct\.|F\.\d+d)\s+\d+'
+)
+_CASE_NAME_PATTERN = re.compile(
+    r'[A-Z][a-zA-Z\'\-]+(?:\s+[A-Z][a-zA-Z\'\-]+)*\s+v\.\s+[A-Z][a-zA-Z\'\-]+(?:\s+[A-Z][a-zA-Z\'\-]+)*'
+)
+_STATUTE_PATTERN = re.compile(
+    r'\d+\s+U\.S\.C\.\s+§+\s*\d+(?:[a-z])?'
+)
+_SECTION_PATTERN = re.compile(
+    r'§+\s*\d+(?:\.\d+)*(?:[a-z])?'
+)
+
 
 # Ensure NLTK resources are available
 try:
@@ -101,17 +154,7 @@ class SentenceTokenizer(Processor):
         text = document.text
         
         # Tokenize into sentences
-        sentences = sent_tokenize(text, language=self.language)
-        
-        # Filter sentences by length if needed
-        if self.min_sentence_length > 0 or self.max_sentence_length:
-            filtered_sentences = []
-            for sentence in sentences:
-                word_count = len(sentence.split())
-                if word_count >= self.min_sentence_length:
-                    if self.max_sentence_length is None or word_count <= self.max_sentence_length:
-                        filtered_sentences.append(sentence)
-            sentences = filtered_sentences
+        sentences = list(self.stream(document))
         
         # Store sentence spans if requested
         if self.store_sentence_spans:
@@ -145,6 +188,31 @@ class SentenceTokenizer(Processor):
         
         return document
     
+    def stream(self, document: Union[ProcessedDocument, Any]) -> Iterator[str]:
+        """Yield the document's sentences one at a time.
+        
+        Sentences are produced from Punkt's span tokenizer and filtered by
+        length without materializing the full sentence list.
+        
+        Args:
+            document: Document to tokenize.
+            
+        Yields:
+            str: Sentences that pass the length filters.
+        """
+        if not isinstance(document, ProcessedDocument):
+            raise TypeError("Expected ProcessedDocument")
+            
+        for sentence in iter_sentences(document.text, language=self.language):
+            # Filter sentences by length if needed
+            if self.min_sentence_length > 0 or self.max_sentence_length:
+                word_count = len(sentence.split())
+                if word_count < self.min_sentence_length:
+                    continue
+                if self.max_sentence_length is not None and word_count > self.max_sentence_length:
+                    continue
+            yield sentence
+    
     def get_stage(self) -> ProcessingStage:
         """Get the processing stage this processor belongs to.
         
@@ -192,7 +260,7 @@ class WordTokenizer(Processor):
         self.store_token_spans = store_token_spans
         
         # Punctuation pattern for filtering
-        self.punctuation_pattern = re.compile(r'^\W+$')
+        self.punctuation_pattern = _PUNCTUATION_PATTERN
         
     def process(self, document: Union[ProcessedDocument, Any]) -> ProcessedDocument:
         """Process a document by tokenizing its text into words.
@@ -212,34 +280,16 @@ class WordTokenizer(Processor):
         
         # Check if we have sentences from previous processing
         if "sentences" in document.processing_metadata:
-            # Tokenize each sentence separately
-            all_tokens = []
-            for sentence in document.processing_metadata["sentences"]:
-                tokens = word_tokenize(sentence, language=self.language)
-                all_tokens.extend(tokens)
+            # Tokenize all sentences with a single tokenizer call
+            all_tokens = list(chain.from_iterable(
+                self._tokenize_sentences(document.processing_metadata["sentences"])
+            ))
         else:
             # Tokenize the entire text
             all_tokens = word_tokenize(text, language=self.language)
         
         # Apply filters
-        filtered_tokens = []
-        for token in all_tokens:
-            # Apply lowercase if requested
-            if self.lowercase:
-                token = token.lower()
-                
-            # Skip punctuation if requested
-            if self.remove_punctuation and self.punctuation_pattern.match(token):
-                continue
-                
-            # Check length constraints
-            if len(token) < self.min_word_length:
-                continue
-                
-            if self.max_word_length is not None and len(token) > self.max_word_length:
-                continue
-                
-            filtered_tokens.append(token)
+        filtered_tokens = self._filter_tokens(all_tokens)
         
         # Store tokens in the document
         document.tokens = filtered_tokens
@@ -275,6 +325,113 @@ class WordTokenizer(Processor):
         
         return document
     
+    def stream(
+        self,
+        document: Union[ProcessedDocument, Any],
+        sentences: Optional[Iterable[str]] = None
+    ) -> Iterator[str]:
+        """Yield the document's filtered tokens one sentence at a time.
+        
+        Passing ``SentenceTokenizer.stream(document)`` as ``sentences`` fuses
+        both stages into a single pass, so only one sentence is held in
+        memory at a time.
+        
+        Args:
+            document: Document to tokenize.
+            sentences: Optional iterable of sentences to tokenize. Defaults to
+                sentences stored by a previous stage, or the whole text.
+            
+        Yields:
+            str: Filtered tokens.
+        """
+        if not isinstance(document, ProcessedDocument):
+            raise TypeError("Expected ProcessedDocument")
+            
+        if sentences is None:
+            sentences = document.processing_metadata.get("sentences", [document.text])
+            
+        return chain.from_iterable(
+            self._filter_tokens(word_tokenize(sentence, language=self.language))
+            for sentence in sentences
+        )
+    
+    def _tokenize_sentences(self, sentences: List[str]) -> List[List[str]]:
+        """Tokenize a list of sentences with one call to the word tokenizer.
+        
+        Sentences are joined around a private-use sentinel character that
+        cannot occur in natural text, tokenized once as a single line, and
+        split back apart on the sentinel token. The result is the same as
+        tokenizing each sentence with preserve_line=True.
+        
+        Args:
+            sentences: Sentences to tokenize.
+            
+        Returns:
+            List[List[str]]: Tokens for each sentence.
+        """
+        if not sentences:
+            return []
+            
+        # NLTK reads a leading '' or a trailing ' differently at the edges of
+        # a text than next to the sentinel, so the few sentences with one are
+        # tokenized on their own
+        separate = [sentence.startswith("''") or sentence.rstrip().endswith("'") for sentence in sentences]
+        
+        # The sentences are already split, so Punkt must not split the
+        # joined text again
+        joined = f" {_SENTENCE_SENTINEL} ".join(
+            "" if alone else _SENTENCE_FINAL_PERIOD.sub(r"\1 \2\3 ", _SENTENCE_INITIAL_QUOTE.sub("``", sentence))
+            for sentence, alone in zip(sentences, separate)
+        )
+        tokens = word_tokenize(joined, language=self.language, preserve_line=True)
+        
+        sentence_tokens = [[]]
+        for token in tokens:
+            if token == _SENTENCE_SENTINEL:
+                sentence_tokens.append([])
+            else:
+                sentence_tokens[-1].append(token)
+                
+        for index, alone in enumerate(separate):
+            if alone:
+                sentence_tokens[index] = word_tokenize(
+                    sentences[index],
+                    language=self.language,
+                    preserve_line=True
+                )
+                
+        return sentence_tokens
+    
+    def _filter_tokens(self, tokens: List[str]) -> List[str]:
+        """Apply lowercasing, punctuation and length filters to tokens.
+        
+        Args:
+            tokens: Raw tokens to filter.
+            
+        Returns:
+            List[str]: Filtered tokens.
+        """
+        filtered_tokens = []
+        for token in tokens:
+            # Apply lowercase if requested
+            if self.lowercase:
+                token = token.lower()
+                
+            # Skip punctuation if requested
+            if self.remove_punctuation and self.punctuation_pattern.match(token):
+                continue
+                
+            # Check length constraints
+            if len(token) < self.min_word_length:
+                continue
+                
+            if self.max_word_length is not None and len(token) > self.max_word_length:
+                continue
+                
+            filtered_tokens.append(token)
+            
+        return filtered_tokens
+    
     def get_stage(self) -> ProcessingStage:
         """Get the processing stage this processor belongs to.
         
@@ -319,18 +476,10 @@ class LegalTokenizer(Processor):
         self.language = language
         
         # Patterns for legal-specific entities
-        self.citation_pattern = re.compile(
-            r'\d+\s+(?:U\.S\.|S\.\s*Ct\.|F\.\d+d)\s+\d+'
-        )
-        self.case_name_pattern = re.compile(
-            r'[A-Z][a-zA-Z\'\-]+(?:\s+[A-Z][a-zA-Z\'\-]+)*\s+v\.\s+[A-Z][a-zA-Z\'\-]+(?:\s+[A-Z][a-zA-Z\'\-]+)*'
-        )
-        self.statute_pattern = re.compile(
-            r'\d+\s+U\.S\.C\.\s+§+\s*\d+(?:[a-z])?'
-        )
-        self.section_pattern = re.compile(
-            r'§+\s*\d+(?:\.\d+)*(?:[a-z])?'
-        )
+        self.citation_pattern = _CITATION_PATTERN
+        self.case_name_pattern = _CASE_NAME_PATTERN
+        self.statute_pattern = _STATUTE_PATTERN
+        self.section_pattern = _SECTION_PATTERN
         
     def process(self, document: Union[ProcessedDocument, Any]) -> ProcessedDocument:
         """Process a document by tokenizing its legal text.
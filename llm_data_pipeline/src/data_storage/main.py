@@ -7,10 +7,10 @@ and raw data in cloud storage solutions.
 
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from ..data_processing.base import ProcessedDocument
-from .mongodb import MongoDBStorage
+from .mongodb import MONGO_BULK_BATCH_SIZE, MongoDBStorage
 from .cloud import S3Storage, LocalStorage
 
 
@@ -26,7 +26,9 @@ logger = logging.getLogger(__name__)
 def create_mongodb_storage(
     connection_string: str,
     database_name: str,
-    collection_name: str
+    collection_name: str,
+    batch_size: int = MONGO_BULK_BATCH_SIZE,
+    fast_insert: bool = False
 ) -> MongoDBStorage:
     """Create a MongoDB storage instance.
     
@@ -34,6 +36,9 @@ def create_mongodb_storage(
         connection_string: MongoDB connection string.
         database_name: Name of the database to use.
         collection_name: Name of the collection to use.
+        batch_size: Maximum number of documents per unordered bulk write.
+        fast_insert: Whether to use unacknowledged writes (w=0) for bulk
+            loads. Write errors are not reported in this mode.
         
     Returns:
         MongoDBStorage: MongoDB storage instance.
@@ -42,7 +47,9 @@ def create_mongodb_storage(
         connection_string=connection_string,
         database_name=database_name,
         collection_name=collection_name,
-        create_indexes=True
+        create_indexes=True,
+        batch_size=batch_size,
+        fast_insert=fast_insert
     )
     
     # Test connection
@@ -60,6 +67,8 @@ def create_s3_storage(
 ) -> S3Storage:
     """Create an S3 storage instance.
     
+    No request is made to S3 until the storage is first used.
+    
     Args:
         bucket_name: Name of the S3 bucket.
         aws_access_key_id: Optional AWS access key ID.
@@ -76,10 +85,8 @@ def create_s3_storage(
         region_name=region_name
     )
     
-    # Test connection
-    if not storage.connect():
-        logger.warning(f"Failed to connect to S3 bucket: {bucket_name}")
-        
+    # The client is created lazily on first use; bucket access errors
+    # surface from the first request rather than an upfront probe
     return storage
 
 
@@ -107,6 +114,9 @@ def store_processed_documents(
 ) -> Dict[str, bool]:
     """Store processed documents in MongoDB.
     
+    Documents are upserted with unordered bulk writes of up to the storage's
+    batch_size documents, one round trip per batch.
+    
     Args:
         storage: MongoDB storage instance.
         documents: List of processed documents to store.
@@ -146,22 +156,31 @@ def store_raw_data(
             # It's a string
             return storage.store_text(data, remote_path, metadata)
     elif isinstance(data, bytes):
-        # Store bytes in a temporary file
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_file.write(data)
-            temp_path = temp_file.name
-            
-        # Store the temporary file
-        result = storage.store_file(temp_path, remote_path, metadata)
-        
-        # Clean up
-        import os
-        os.unlink(temp_path)
-        
-        return result
+        # Store bytes directly, without a temporary file
+        return storage.store_bytes(data, remote_path, metadata)
     elif isinstance(data, Path):
         # It's a file path
         return storage.store_file(data, remote_path, metadata)
     else:
         logger.error(f"Unsupported data type: {type(data)}")
         return False
+
+
+def store_raw_texts(
+    storage: Union[S3Storage, LocalStorage],
+    items: List[Tuple[str, str, Optional[Dict[str, str]]]]
+) -> Dict[str, bool]:
+    """Store multiple raw texts in cloud storage.
+    
+    S3 storage uploads the texts concurrently; other backends store them
+    one at a time.
+    
+    Args:
+        storage: Cloud storage instance.
+        items: List of (text, remote_path, metadata) tuples.
+        
+    Returns:
+        Dict[str, bool]: Dictionary mapping remote paths to storage success.
+    """
+    logger.info(f"Storing {len(items)} raw texts in cloud storage")
+    return storage.store_texts(items)
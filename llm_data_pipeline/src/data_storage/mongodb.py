@@ -6,19 +6,226 @@ with support for indexing, querying, and versioning.
 """
 
 import logging
+import operator
 import os
+import threading
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import pymongo
-from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure, OperationFailure
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+from pymongo import MongoClient, WriteConcern
+from pymongo.errors import BulkWriteError, ConnectionFailure, OperationFailure
 
 from ..data_processing.base import ProcessedDocument
 
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of operations sent in a single bulk_write call
+MONGO_BULK_BATCH_SIZE = 1000
+
+# Projection that leaves out the (large) tokens array; callers that only
+# need the text can pass this to get_document/iter_documents
+EXCLUDE_TOKENS: Dict[str, bool] = {"tokens": False}
+
+# ProcessedDocument attributes stored under the same key in MongoDB. The
+# immutable ones identify the document and are only written when it is first
+# inserted; everything a reprocessing run can change is rewritten on every
+# store, so text, tokens and token_count always stay consistent
+_IMMUTABLE_FIELDS = (
+    "id",
+    "source",
+    "source_id",
+)
+_MUTABLE_FIELDS = (
+    "text",
+    "tokens",
+    "token_count",
+    "quality_score",
+    "quality_metrics",
+    "original_metadata",
+    "enhanced_metadata",
+    "processing_history",
+)
+_get_immutable_fields = operator.attrgetter(*_IMMUTABLE_FIELDS)
+_get_mutable_fields = operator.attrgetter(*_MUTABLE_FIELDS)
+
+# Single-field indexes created by earlier versions that are now either
+# low-cardinality or covered by a prefix of a compound index; existing
+# collections can drop them with MongoDBStorage.drop_legacy_indexes()
+_LEGACY_INDEXES = (
+    "source_1",
+    "metadata.filtered_1",
+    "metadata.duplicate_1",
+    "metadata.dataset_version_1",
+)
+
+# Wire compressors offered to the server, in order of preference. zlib is
+# built into Python; zstd and snappy also need the zstandard and
+# python-snappy packages, so they are only used when configured
+MONGO_COMPRESSORS = os.environ.get("MONGODB_COMPRESSORS", "zlib")
+
+# Separator used to pack a document's tokens into a single BSON string
+_TOKEN_SEPARATOR = "\x00"
+
+
+def _pack_tokens(tokens: Optional[List[str]]) -> Union[str, List[str], None]:
+    """Pack string tokens into one separator-joined string for storage.
+    
+    A BSON array spends a type byte, an index key and a terminator on every
+    element, which for short word tokens is more than the token itself.
+    
+    Args:
+        tokens: Tokens to pack.
+        
+    Returns:
+        Union[str, List[str], None]: The packed tokens, or the tokens
+            unchanged if they are empty, not strings, or contain the separator.
+    """
+    if not tokens:
+        return tokens
+        
+    try:
+        packed = _TOKEN_SEPARATOR.join(tokens)
+    except TypeError:
+        return tokens
+        
+    # A token containing the separator couldn't be unpacked again
+    if packed.count(_TOKEN_SEPARATOR) != len(tokens) - 1:
+        return tokens
+        
+    return packed
+
+
+def unpack_tokens(tokens: Union[str, List[str], None]) -> Optional[List[str]]:
+    """Unpack tokens stored by _pack_tokens.
+    
+    Args:
+        tokens: Stored tokens, packed or as a list.
+        
+    Returns:
+        Optional[List[str]]: The tokens as a list.
+    """
+    if isinstance(tokens, str):
+        return tokens.split(_TOKEN_SEPARATOR)
+        
+    return tokens
+
+
+# MongoClients shared by all storage instances in the process, keyed by
+# connection string, with the number of storage instances using each one
+_CLIENT_CACHE: Dict[str, MongoClient] = {}
+_CLIENT_REFCOUNTS: Dict[str, int] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+# Collections whose indexes were already created by this process, keyed by
+# (connection string, database, collection, text index enabled)
+_INDEXED_COLLECTIONS: Set[Tuple[str, str, str, bool]] = set()
+
+
+def _create_client(connection_string: str) -> MongoClient:
+    """Create a pooled MongoClient.
+    
+    Wire compression is negotiated with the server from MONGO_COMPRESSORS,
+    which is read from the MONGODB_COMPRESSORS environment variable.
+    
+    Args:
+        connection_string: MongoDB connection string.
+        
+    Returns:
+        MongoClient: A new client.
+    """
+    return MongoClient(
+        connection_string,
+        maxPoolSize=100,
+        compressors=MONGO_COMPRESSORS,
+        zlibCompressionLevel=3
+    )
+
+
+def _acquire_client(connection_string: str) -> MongoClient:
+    """Get the shared MongoClient for a connection string.
+    
+    Args:
+        connection_string: MongoDB connection string.
+        
+    Returns:
+        MongoClient: The shared client. Call _release_client when done.
+    """
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(connection_string)
+        if client is None:
+            client = _create_client(connection_string)
+            _CLIENT_CACHE[connection_string] = client
+            
+        _CLIENT_REFCOUNTS[connection_string] = _CLIENT_REFCOUNTS.get(connection_string, 0) + 1
+        return client
+
+
+def _release_client(connection_string: str) -> None:
+    """Release a shared MongoClient, closing it once nothing uses it.
+    
+    Args:
+        connection_string: MongoDB connection string.
+    """
+    with _CLIENT_CACHE_LOCK:
+        refcount = _CLIENT_REFCOUNTS.get(connection_string, 0) - 1
+        if refcount > 0:
+            _CLIENT_REFCOUNTS[connection_string] = refcount
+            return
+            
+        _CLIENT_REFCOUNTS.pop(connection_string, None)
+        client = _CLIENT_CACHE.pop(connection_string, None)
+        
+    if client is not None:
+        client.close()
+
+
+def _bulk_write(
+    collection: Any,
+    document_ids: List[str],
+    updates: List[Dict[str, Any]]
+) -> Dict[str, bool]:
+    """Execute one unordered bulk upsert and report success per document.
+    
+    Args:
+        collection: Collection to write to.
+        document_ids: IDs of the documents.
+        updates: Update documents, in the same order as the IDs.
+        
+    Returns:
+        Dict[str, bool]: Dictionary mapping document IDs to storage success.
+    """
+    try:
+        operations = [
+            pymongo.UpdateOne({"id": document_id}, update, upsert=True)
+            for document_id, update in zip(document_ids, updates)
+        ]
+        collection.bulk_write(operations, ordered=False)
+        return dict.fromkeys(document_ids, True)
+        
+    except BulkWriteError as e:
+        # A write concern error means no write in the batch is known
+        # to be durable
+        if e.details.get("writeConcernErrors"):
+            logger.error(f"Write concern error in bulk document storage: {e}")
+            return dict.fromkeys(document_ids, False)
+            
+        # With ordered=False every other write was still applied
+        results = dict.fromkeys(document_ids, True)
+        for error in e.details.get("writeErrors", ()):
+            document_id = document_ids[error["index"]]
+            results[document_id] = False
+            logger.error(f"Error storing document {document_id}: {error.get('errmsg')}")
+            
+        return results
+        
+    except Exception as e:
+        logger.exception(f"Error in bulk document storage: {e}")
+        return dict.fromkeys(document_ids, False)
+
 
 class MongoDBStorage:
     """MongoDB storage for processed documents."""
@@ -28,7 +235,11 @@ class MongoDBStorage:
         connection_string: str,
         database_name: str,
         collection_name: str,
-        create_indexes: bool = True
+        create_indexes: bool = True,
+        batch_size: int = MONGO_BULK_BATCH_SIZE,
+        fast_insert: bool = False,
+        enable_text_index: bool = False,
+        pack_tokens: bool = False
     ):
         """Initialize MongoDB storage.
         
@@ -37,15 +248,63 @@ class MongoDBStorage:
             database_name: Name of the database to use.
             collection_name: Name of the collection to use.
             create_indexes: Whether to create indexes on the collection.
+            batch_size: Maximum number of operations per bulk write. Single
+                document writes are buffered until this many are pending.
+            fast_insert: Whether to store documents with unacknowledged
+                writes (w=0). Document stores no longer wait for the server,
+                but write errors such as duplicate keys or validation
+                failures are silently lost. Index creation, deletes and
+                dataset versioning stay acknowledged. Only use this for
+                non-critical bulk ingestion.
+            enable_text_index: Whether to create a full-text index on the
+                text field for $text queries. Text indexes impact write
+                performance and can greatly increase the index size, due to
+                big texts, so they are off by default.
+            pack_tokens: Whether to store tokens as one separator-joined
+                string instead of an array, which makes documents smaller.
+                Off by default because it changes the stored format: array
+                queries on the tokens field (e.g. {"tokens": "court"}) no
+                longer match packed documents, and other readers of the
+                collection must unpack them with unpack_tokens. Reading
+                through this class handles both formats, so the flag can be
+                turned on for an existing collection; documents are
+                converted as they are re-stored.
         """
         self.connection_string = connection_string
         self.database_name = database_name
         self.collection_name = collection_name
         self.create_indexes = create_indexes
+        self.batch_size = batch_size
+        self.fast_insert = fast_insert
+        self.enable_text_index = enable_text_index
+        self.pack_tokens = pack_tokens
         
         self.client = None
         self.db = None
         self.collection = None
+        self._raw_collection = None
+        self._write_collection = None
+        self._connected = False
+        
+        # Updates from store_document waiting to be sent in one bulk write,
+        # keyed by document ID so storing a document again before a flush
+        # replaces its pending update (last write wins); the UpdateOne
+        # objects are only built on flush
+        self._buffer: Dict[str, Dict[str, Any]] = {}
+        self._buffer_lock = threading.Lock()
+        
+    def __enter__(self) -> "MongoDBStorage":
+        """Connect to MongoDB when entering a with block.
+        
+        Returns:
+            MongoDBStorage: This storage instance.
+        """
+        self._ensure_connected()
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Flush buffered writes and close the connection on leaving a with block."""
+        self.close()
         
     def connect(self) -> bool:
         """Connect to MongoDB.
@@ -54,8 +313,10 @@ class MongoDBStorage:
             bool: True if connection was successful, False otherwise.
         """
         try:
-            # Connect to MongoDB
-            self.client = MongoClient(self.connection_string)
+            # Connect to MongoDB, sharing one client (and connection pool)
+            # with other storage instances using the same connection string
+            if self.client is None:
+                self.client = _acquire_client(self.connection_string)
             
             # Check connection
             self.client.admin.command('ping')
@@ -64,10 +325,22 @@ class MongoDBStorage:
             self.db = self.client[self.database_name]
             self.collection = self.db[self.collection_name]
             
-            # Create indexes if requested
-            if self.create_indexes:
+            # Don't wait for write acknowledgements of document stores if
+            # requested; other operations keep using the acknowledged
+            # collection, since they need their results
+            if self.fast_insert:
+                self._write_collection = self.collection.with_options(
+                    write_concern=WriteConcern(w=0)
+                )
+            else:
+                self._write_collection = self.collection
+            
+            # Create indexes if requested, unless another storage instance
+            # (e.g. an earlier task run) already did so for this collection
+            if self.create_indexes and self._index_key() not in _INDEXED_COLLECTIONS:
                 self._create_indexes()
                 
+            self._connected = True
             logger.info(f"Connected to MongoDB: {self.database_name}.{self.collection_name}")
             return True
             
@@ -79,136 +352,230 @@ class MongoDBStorage:
             logger.exception(f"Error connecting to MongoDB: {e}")
             return False
             
+    def _ensure_connected(self) -> bool:
+        """Connect to MongoDB unless already connected.
+        
+        Returns:
+            bool: True if connected, False otherwise.
+        """
+        return self._connected or self.connect()
+        
+    def _index_key(self) -> Tuple[str, str, str, bool]:
+        """Get the key identifying this collection's indexes.
+        
+        Returns:
+            Tuple[str, str, str, bool]: Key in _INDEXED_COLLECTIONS.
+        """
+        return (self.connection_string, self.database_name, self.collection_name, self.enable_text_index)
+        
     def _create_indexes(self) -> None:
         """Create indexes on the collection."""
         try:
             # Create indexes for common query fields
             self.collection.create_index("id", unique=True)
-            self.collection.create_index("source")
             self.collection.create_index("source_id")
             self.collection.create_index("quality_score")
             self.collection.create_index("token_count")
-            self.collection.create_index("metadata.filtered")
-            self.collection.create_index("metadata.duplicate")
-            self.collection.create_index("metadata.dataset_version")
             
-            # Create text index for full-text search
-            self.collection.create_index([("text", pymongo.TEXT)])
+            # Compound indexes ordered equality -> sort/range, so filtering
+            # by source and version and sorting by quality uses one index
+            self.collection.create_index(
+                [("source", 1), ("metadata.dataset_version", 1), ("quality_score", -1)]
+            )
+            self.collection.create_index(
+                [("metadata.dataset_version", 1), ("metadata.filtered", 1), ("token_count", 1)]
+            )
+            
+            # Index for the usual dataset version selection: documents that
+            # weren't filtered out or deduplicated, above a quality threshold
+            self.collection.create_index(
+                [("metadata.filtered", 1), ("metadata.duplicate", 1), ("quality_score", -1)]
+            )
             
+            # Create text index for full-text search if requested
+            if self.enable_text_index:
+                self.collection.create_index([("text", pymongo.TEXT)])
+            
+            _INDEXED_COLLECTIONS.add(self._index_key())
             logger.info(f"Created indexes on {self.collection_name}")
             
         except OperationFailure as e:
             logger.error(f"Failed to create indexes: {e}")
             
+    def drop_legacy_indexes(self) -> List[str]:
+        """Drop single-field indexes created by earlier versions.
+        
+        This is a one-off migration for collections created before the
+        compound indexes were introduced. It is never run automatically:
+        run it once the compound indexes exist and no running code relies
+        on the old indexes.
+        
+        Returns:
+            List[str]: Names of the dropped indexes.
+        """
+        if not self._ensure_connected():
+            return []
+            
+        dropped = []
+        
+        try:
+            existing = self.collection.index_information()
+            for index_name in _LEGACY_INDEXES:
+                if index_name in existing:
+                    self.collection.drop_index(index_name)
+                    dropped.append(index_name)
+                    logger.info(f"Dropped legacy index {index_name} on {self.collection_name}")
+                    
+        except OperationFailure as e:
+            logger.error(f"Failed to drop legacy indexes: {e}")
+            
+        return dropped
+        
     def store_document(self, document: ProcessedDocument) -> bool:
-        """Store a processed document in MongoDB.
+        """Buffer a processed document for storage in MongoDB.
+        
+        The write is buffered and sent together with other buffered writes
+        in one unordered bulk write once batch_size writes are pending, or
+        when flush() or close() is called (including on leaving a with
+        block). Storing a document again before it is flushed replaces the
+        pending write.
         
         Args:
             document: Processed document to store.
             
         Returns:
-            bool: True if storage was successful, False otherwise.
+            bool: True if the document was buffered, False otherwise. This
+                does not mean the document was stored: when the write
+                filled the buffer, it is True only if every write in the
+                triggered flush succeeded. Call flush() to find out which
+                buffered documents failed.
         """
-        if not self.collection:
-            if not self.connect():
-                return False
-                
+        if not self._ensure_connected():
+            return False
+            
         try:
-            # Convert ProcessedDocument to dict
-            doc_dict = self._document_to_dict(document)
+            # Convert ProcessedDocument to dicts
+            immutable_dict, mutable_dict = self._document_to_dict(document)
             
             # Add storage metadata
-            doc_dict["storage_metadata"] = {
+            mutable_dict["storage_metadata"] = {
                 "stored_at": datetime.utcnow(),
                 "version": "1.0"
             }
             
-            # Insert or update document
-            result = self.collection.update_one(
-                {"id": document.id},
-                {"$set": doc_dict},
-                upsert=True
-            )
-            
-            return result.acknowledged
+            # Buffer the insert or update
+            with self._buffer_lock:
+                self._buffer[document.id] = {"$setOnInsert": immutable_dict, "$set": mutable_dict}
+                buffer_full = len(self._buffer) >= self.batch_size
+                
+            if buffer_full:
+                return all(self.flush().values())
+                
+            return True
             
         except Exception as e:
             logger.exception(f"Error storing document {document.id}: {e}")
             return False
             
+    def flush(self) -> Dict[str, bool]:
+        """Send all buffered document writes to MongoDB.
+        
+        Returns:
+            Dict[str, bool]: Dictionary mapping the IDs of the buffered
+                documents to storage success, so failed writes can be retried.
+        """
+        with self._buffer_lock:
+            buffered, self._buffer = self._buffer, {}
+            
+        if not buffered:
+            return {}
+            
+        return _bulk_write(self._write_collection, list(buffered), list(buffered.values()))
+        
     def store_documents(self, documents: List[ProcessedDocument]) -> Dict[str, bool]:
         """Store multiple processed documents in MongoDB.
         
+        Documents are written in unordered bulk writes of at most batch_size
+        operations. The errors reported by each bulk write are mapped back to
+        their documents, so a failed write only marks its own document as
+        failed and the result is an accurate retry set.
+        
         Args:
             documents: List of processed documents to store.
             
         Returns:
             Dict[str, bool]: Dictionary mapping document IDs to storage success.
         """
-        if not self.collection:
-            if not self.connect():
-                return {doc.id: False for doc in documents}
-                
-        results = {}
-        
+        if not self._ensure_connected():
+            return {doc.id: False for doc in documents}
+            
         try:
             # Prepare bulk operations
-            operations = []
+            document_ids = []
+            updates = []
+            
+            # Storage metadata is the same for the whole batch, so one
+            # (never mutated) dict is shared by every document
+            storage_metadata = {
+                "stored_at": datetime.utcnow(),
+                "version": "1.0"
+            }
             
             for document in documents:
-                # Convert ProcessedDocument to dict
-                doc_dict = self._document_to_dict(document)
+                # Convert ProcessedDocument to dicts
+                immutable_dict, mutable_dict = self._document_to_dict(document)
                 
                 # Add storage metadata
-                doc_dict["storage_metadata"] = {
-                    "stored_at": datetime.utcnow(),
-                    "version": "1.0"
-                }
+                mutable_dict["storage_metadata"] = storage_metadata
                 
                 # Add update operation
-                operations.append(
-                    pymongo.UpdateOne(
-                        {"id": document.id},
-                        {"$set": doc_dict},
-                        upsert=True
-                    )
-                )
-                
-            # Execute bulk operations
-            if operations:
-                result = self.collection.bulk_write(operations, ordered=False)
+                document_ids.append(document.id)
+                updates.append({"$setOnInsert": immutable_dict, "$set": mutable_dict})
                 
-                # Track results
-                for document in documents:
-                    results[document.id] = True
-                    
-            return results
-            
         except Exception as e:
             logger.exception(f"Error in bulk document storage: {e}")
             
             # Mark all as failed
-            for document in documents:
-                results[document.id] = False
-                
-            return results
+            return {doc.id: False for doc in documents}
+            
+        # Split bulk operations into batches of at most batch_size
+        batches = [
+            (document_ids[start:start + self.batch_size], updates[start:start + self.batch_size])
+            for start in range(0, len(document_ids), self.batch_size)
+        ]
+        
+        results = {}
+        
+        for batch_ids, batch_updates in batches:
+            results.update(_bulk_write(self._write_collection, batch_ids, batch_updates))
             
-    def get_document(self, document_id: str) -> Optional[ProcessedDocument]:
+        return results
+        
+    def get_document(
+        self,
+        document_id: str,
+        projection: Optional[Dict[str, Any]] = None
+    ) -> Optional[ProcessedDocument]:
         """Retrieve a document from MongoDB by ID.
         
         Args:
             document_id: ID of the document to retrieve.
+            projection: Optional projection limiting the fields returned,
+                e.g. EXCLUDE_TOKENS. It must keep id, source, source_id and
+                text; fields left out are None or empty on the document.
             
         Returns:
             Optional[ProcessedDocument]: Retrieved document, or None if not found.
         """
-        if not self.collection:
-            if not self.connect():
-                return None
-                
+        if not self._ensure_connected():
+            return None
+            
+        # Make buffered writes visible to this operation
+        self.flush()
+        
         try:
             # Query for document
-            doc_dict = self.collection.find_one({"id": document_id})
+            doc_dict = self.collection.find_one({"id": document_id}, projection=projection)
             
             if not doc_dict:
                 return None
@@ -220,46 +587,133 @@ class MongoDBStorage:
             logger.exception(f"Error retrieving document {document_id}: {e}")
             return None
             
+    def iter_documents(
+        self,
+        query: Dict[str, Any],
+        limit: Optional[int] = None,
+        skip: Optional[int] = None,
+        sort_by: Optional[List[tuple]] = None,
+        batch_size: int = 500,
+        raw: bool = False,
+        projection: Optional[Dict[str, Any]] = None,
+        hint: Optional[Union[str, List[tuple]]] = None
+    ) -> Iterator[Union[ProcessedDocument, RawBSONDocument]]:
+        """Stream documents matching a query from MongoDB.
+        
+        Results are fetched from the server batch_size documents at a time,
+        so memory use is bounded by one batch rather than the result set.
+        
+        Args:
+            query: MongoDB query dictionary.
+            limit: Optional limit on number of results.
+            skip: Optional number of documents to skip.
+            sort_by: Optional list of (field, direction) tuples for sorting.
+            batch_size: Number of documents fetched per server round trip.
+            raw: Whether to yield undecoded RawBSONDocuments instead of
+                ProcessedDocuments. Fields are only decoded when accessed,
+                which is much cheaper for read-only stages that never touch
+                the large text or tokens fields. Raw tokens stored with
+                pack_tokens are not unpacked; use unpack_tokens to get the
+                list.
+            projection: Optional projection limiting the fields returned,
+                e.g. EXCLUDE_TOKENS. Unless raw is set, it must keep id,
+                source, source_id and text.
+            hint: Optional index name or key pattern forcing the query to use
+                that index. For example, when filtering by source and
+                metadata.dataset_version and sorting by quality_score, pass
+                [("source", 1), ("metadata.dataset_version", 1), ("quality_score", -1)]
+                so the planner can't pick a less selective single-field index.
+            
+        Yields:
+            Union[ProcessedDocument, RawBSONDocument]: Retrieved documents.
+        """
+        if not self._ensure_connected():
+            return
+            
+        # Make buffered writes visible to this operation
+        self.flush()
+        
+        # Prepare cursor
+        collection = self._get_raw_collection() if raw else self.collection
+        cursor = collection.find(query, projection=projection, no_cursor_timeout=False)
+        cursor = cursor.batch_size(batch_size)
+        
+        # Apply skip if provided
+        if skip is not None:
+            cursor = cursor.skip(skip)
+            
+        # Apply limit if provided
+        if limit is not None:
+            cursor = cursor.limit(limit)
+            
+        # Apply sorting if provided
+        if sort_by:
+            cursor = cursor.sort(sort_by)
+            
+        # Force the index if provided
+        if hint is not None:
+            cursor = cursor.hint(hint)
+            
+        # Convert results to ProcessedDocuments as they arrive
+        with cursor:
+            if raw:
+                yield from cursor
+            else:
+                for doc in cursor:
+                    yield self._dict_to_document(doc)
+                    
+    def _get_raw_collection(self) -> Any:
+        """Get a handle on the collection that returns RawBSONDocuments.
+        
+        Returns:
+            Any: The collection with raw BSON codec options.
+        """
+        if self._raw_collection is None:
+            self._raw_collection = self.collection.with_options(
+                codec_options=CodecOptions(document_class=RawBSONDocument)
+            )
+            
+        return self._raw_collection
+        
     def query_documents(
         self,
         query: Dict[str, Any],
         limit: Optional[int] = None,
         skip: Optional[int] = None,
-        sort_by: Optional[List[tuple]] = None
-    ) -> List[ProcessedDocument]:
+        sort_by: Optional[List[tuple]] = None,
+        raw: bool = False,
+        projection: Optional[Dict[str, Any]] = None,
+        hint: Optional[Union[str, List[tuple]]] = None
+    ) -> List[Union[ProcessedDocument, RawBSONDocument]]:
         """Query documents from MongoDB.
         
+        Deprecated: this loads the whole result set into memory. Use
+        iter_documents() to stream large result sets.
+        
         Args:
             query: MongoDB query dictionary.
             limit: Optional limit on number of results.
             skip: Optional number of documents to skip.
             sort_by: Optional list of (field, direction) tuples for sorting.
+            raw: Whether to return undecoded RawBSONDocuments.
+            projection: Optional projection limiting the fields returned.
+            hint: Optional index name or key pattern the query must use.
             
         Returns:
-            List[ProcessedDocument]: List of retrieved documents.
+            List[Union[ProcessedDocument, RawBSONDocument]]: List of retrieved documents.
         """
-        if not self.collection:
-            if not self.connect():
-                return []
-                
         try:
-            # Prepare cursor
-            cursor = self.collection.find(query)
-            
-            # Apply skip if provided
-            if skip is not None:
-                cursor = cursor.skip(skip)
-                
-            # Apply limit if provided
-            if limit is not None:
-                cursor = cursor.limit(limit)
-                
-            # Apply sorting if provided
-            if sort_by:
-                cursor = cursor.sort(sort_by)
-                
-            # Convert results to ProcessedDocuments
-            return [self._dict_to_document(doc) for doc in cursor]
+            return list(
+                self.iter_documents(
+                    query,
+                    limit=limit,
+                    skip=skip,
+                    sort_by=sort_by,
+                    raw=raw,
+                    projection=projection,
+                    hint=hint
+                )
+            )
             
         except Exception as e:
             logger.exception(f"Error querying documents: {e}")
@@ -268,17 +722,25 @@ class MongoDBStorage:
     def count_documents(self, query: Dict[str, Any]) -> int:
         """Count documents matching a query.
         
+        An empty query is answered from collection metadata with
+        estimated_document_count() instead of scanning the collection.
+        
         Args:
             query: MongoDB query dictionary.
             
         Returns:
             int: Number of matching documents.
         """
-        if not self.collection:
-            if not self.connect():
-                return 0
-                
+        if not self._ensure_connected():
+            return 0
+            
+        # Make buffered writes visible to this operation
+        self.flush()
+        
         try:
+            if not query:
+                return self.collection.estimated_document_count()
+                
             return self.collection.count_documents(query)
             
         except Exception as e:
@@ -294,10 +756,12 @@ class MongoDBStorage:
         Returns:
             bool: True if deletion was successful, False otherwise.
         """
-        if not self.collection:
-            if not self.connect():
-                return False
-                
+        if not self._ensure_connected():
+            return False
+            
+        # Make buffered writes visible to this operation
+        self.flush()
+        
         try:
             result = self.collection.delete_one({"id": document_id})
             return result.deleted_count == 1
@@ -313,6 +777,9 @@ class MongoDBStorage:
     ) -> int:
         """Create a new dataset version by tagging matching documents.
         
+        Queries on metadata.filtered, metadata.duplicate and a quality_score
+        range are served by a compound index rather than a collection scan.
+        
         Args:
             version_name: Name of the dataset version.
             query: Optional query to filter documents for this version.
@@ -320,23 +787,24 @@ class MongoDBStorage:
         Returns:
             int: Number of documents in the version.
         """
-        if not self.collection:
-            if not self.connect():
-                return 0
-                
+        if not self._ensure_connected():
+            return 0
+            
+        # Make buffered writes visible to this operation
+        self.flush()
+        
         try:
             # Use empty query if none provided
             if query is None:
                 query = {}
                 
-            # Add version tag to matching documents
+            # Add version tag to matching documents; the server fills in the
+            # creation time rather than receiving it with the update
             result = self.collection.update_many(
                 query,
                 {
-                    "$set": {
-                        "metadata.dataset_version": version_name,
-                        "metadata.version_created_at": datetime.utcnow()
-                    }
+                    "$set": {"metadata.dataset_version": version_name},
+                    "$currentDate": {"metadata.version_created_at": True}
                 }
             )
             
@@ -346,32 +814,29 @@ class MongoDBStorage:
             logger.exception(f"Error creating dataset version {version_name}: {e}")
             return 0
             
-    def _document_to_dict(self, document: ProcessedDocument) -> Dict[str, Any]:
-        """Convert a ProcessedDocument to a dictionary for MongoDB storage.
+    def _document_to_dict(
+        self,
+        document: ProcessedDocument
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Convert a ProcessedDocument to dictionaries for MongoDB storage.
         
         Args:
             document: ProcessedDocument to convert.
             
         Returns:
-            Dict[str, Any]: Dictionary representation of the document.
+            Tuple[Dict[str, Any], Dict[str, Any]]: Fields that are only set
+                when the document is inserted (for $setOnInsert) and fields
+                that are updated on every store (for $set).
         """
-        # Create base dictionary
-        doc_dict = {
-            "id": document.id,
-            "source": document.source,
-            "source_id": document.source_id,
-            "text": document.text,
-            "tokens": document.tokens,
-            "token_count": document.token_count,
-            "quality_score": document.quality_score,
-            "quality_metrics": document.quality_metrics,
-            "original_metadata": document.original_metadata,
-            "enhanced_metadata": document.enhanced_metadata,
-            "processing_history": document.processing_history,
-            "metadata": document.processing_metadata
-        }
-        
-        return doc_dict
+        # Create base dictionaries (attribute lookups and dict building
+        # happen in C rather than one bytecode sequence per field)
+        immutable_dict = dict(zip(_IMMUTABLE_FIELDS, _get_immutable_fields(document)))
+        mutable_dict = dict(zip(_MUTABLE_FIELDS, _get_mutable_fields(document)))
+        if self.pack_tokens:
+            mutable_dict["tokens"] = _pack_tokens(document.tokens)
+        mutable_dict["metadata"] = document.processing_metadata
+        
+        return immutable_dict, mutable_dict
         
     def _dict_to_document(self, doc_dict: Dict[str, Any]) -> ProcessedDocument:
         """Convert a dictionary from MongoDB to a ProcessedDocument.
@@ -382,31 +847,24 @@ class MongoDBStorage:
         Returns:
             ProcessedDocument: Converted document.
         """
-        # Create ProcessedDocument
-        doc = ProcessedDocument(
-            id=doc_dict["id"],
-            source=doc_dict["source"],
-            source_id=doc_dict["source_id"],
-            text=doc_dict["text"]
-        )
-        
-        # Set additional fields
-        doc.tokens = doc_dict.get("tokens")
-        doc.token_count = doc_dict.get("token_count")
-        doc.quality_score = doc_dict.get("quality_score")
-        doc.quality_metrics = doc_dict.get("quality_metrics", {})
-        doc.original_metadata = doc_dict.get("original_metadata", {})
-        doc.enhanced_metadata = doc_dict.get("enhanced_metadata", {})
-        doc.processing_history = doc_dict.get("processing_history", [])
-        doc.processing_metadata = doc_dict.get("metadata", {})
+        doc = ProcessedDocument.from_mongo(doc_dict)
+        doc.tokens = unpack_tokens(doc.tokens)
         
         return doc
         
     def close(self) -> None:
-        """Close the MongoDB connection."""
-        if self.client:
-            self.client.close()
+        """Close the MongoDB connection, flushing any buffered writes.
+        
+        The underlying client is shared and only closed once no other
+        storage instance is using it.
+        """
+        if self.client is not None:
+            self.flush()
+            _release_client(self.connection_string)
             self.client = None
             self.db = None
             self.collection = None
+            self._raw_collection = None
+            self._write_collection = None
+            self._connected = False
             logger.info("Closed MongoDB connection")
@@ -1,9 +1,27 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
+# Set once the .env file has been loaded; inherited by child processes
+_DOTENV_LOADED_VAR = 'LLM_PIPELINE_DOTENV_LOADED'
+
+
+@lru_cache(maxsize=None)
+def load_env():
+    """Load environment variables from the .env file once per process tree.
+    
+    Worker processes inherit the loaded variables through their environment,
+    so they skip the .env file lookup and read.
+    """
+    if os.environ.get(_DOTENV_LOADED_VAR):
+        return
+    load_dotenv()
+    os.environ[_DOTENV_LOADED_VAR] = '1'
+
+
 # Load environment variables from .env file
-load_dotenv()
+load_env()
 
 class Config:
     """Configuration class for the LLM data pipeline."""
@@ -5,12 +5,19 @@ This module provides a simple interface for running the pipeline
 with different configurations.
 """
 
+import json
 import logging
 import os
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional
 
+# orjson is optional and only used to parse configuration files faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .prefect_flow import llm_data_pipeline
 
 
@@ -46,9 +53,11 @@ def run_pipeline(
     """
     # Load configuration from file if provided
     if config_path:
-        import json
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        if orjson is not None:
+            config = orjson.loads(Path(config_path).read_bytes())
+        else:
+            with open(config_path, 'r') as f:
+                config = json.load(f)
     else:
         # Use default configuration
         config = {
@@ -5,23 +5,33 @@ This module provides a Prefect-based implementation for orchestrating
 the entire pipeline, from data collection to storage.
 """
 
+import atexit
 import logging
+import multiprocessing
 import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Generator, List, Optional, Tuple, Union
 
 from prefect import flow, task
 from prefect.logging import get_run_logger
+from prefect.task_runners import ConcurrentTaskRunner
 
+from ..data_collection.base import Document
 from ..data_collection.main import create_collector, collect_documents
+from ..data_processing.base import ProcessedDocument, ProcessingPipeline
 from ..data_processing.main import create_default_pipeline, process_documents
+from ..data_storage.mongodb import MONGO_BULK_BATCH_SIZE
 from ..data_storage.main import (
     create_mongodb_storage,
     create_local_storage,
     create_s3_storage,
     store_processed_documents,
-    store_raw_data
+    store_raw_texts
 )
 
 
@@ -33,28 +43,105 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Worker processes used by process_data_task, created on first use
+_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+_PROCESS_POOL_WORKERS = 0
+_PROCESS_POOL_LOCK = threading.Lock()
 
-@task(name="collect_data_task")
-def collect_data_task(
+
+def _get_process_pool(workers: int) -> ProcessPoolExecutor:
+    """Get the shared processing pool with the given number of workers.
+    
+    Workers are started with forkserver where available, so they don't
+    inherit the parent's threads and open connections.
+    
+    Args:
+        workers: Number of worker processes.
+        
+    Returns:
+        ProcessPoolExecutor: The processing pool.
+    """
+    global _PROCESS_POOL, _PROCESS_POOL_WORKERS
+    
+    with _PROCESS_POOL_LOCK:
+        if _PROCESS_POOL is None or _PROCESS_POOL_WORKERS != workers:
+            if _PROCESS_POOL is not None:
+                _PROCESS_POOL.shutdown(wait=True)
+                
+            if "forkserver" in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context("forkserver")
+            else:
+                context = multiprocessing.get_context("spawn")
+                
+            _PROCESS_POOL = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+            _PROCESS_POOL_WORKERS = workers
+            
+        return _PROCESS_POOL
+
+
+def _shutdown_process_pool() -> None:
+    """Stop the shared processing pool."""
+    if _PROCESS_POOL is not None:
+        _PROCESS_POOL.shutdown(wait=True)
+
+
+atexit.register(_shutdown_process_pool)
+
+
+@lru_cache(maxsize=None)
+def _default_pipeline() -> ProcessingPipeline:
+    """Get the default processing pipeline, built once per process.
+    
+    The processors only hold configuration, so one pipeline can be shared
+    by every task run (and every batch of a pool worker) in the process.
+    
+    Returns:
+        ProcessingPipeline: The default processing pipeline.
+    """
+    return create_default_pipeline()
+
+
+def _process_batch(
+    batch: List[Tuple[str, str, Dict[str, Any], str, str]],
+    batch_size: int
+) -> List[ProcessedDocument]:
+    """Process a batch of documents in a pool worker.
+    
+    Args:
+        batch: Documents as (id, text, metadata, source, source_id) tuples.
+        batch_size: Size of batches for processing.
+        
+    Returns:
+        List[ProcessedDocument]: Processed documents.
+    """
+    documents = [Document._make(fields) for fields in batch]
+    
+    return list(process_documents(
+        documents=documents,
+        pipeline=_default_pipeline(),
+        batch_size=batch_size
+    ))
+
+
+def _iter_document_batches(
     source_type: str,
     source_name: str,
     source_config: Dict[str, Any],
-    limit: Optional[int] = None
-) -> List[Dict[str, Any]]:
-    """Collect data from a source.
+    limit: Optional[int] = None,
+    batch_size: int = 1000
+) -> Generator[List[Document], None, None]:
+    """Collect documents from a source and yield them in batches.
     
     Args:
         source_type: Type of data source.
         source_name: Name of the data source.
         source_config: Configuration for the data source.
         limit: Optional maximum number of documents to collect.
+        batch_size: Number of documents per batch.
         
-    Returns:
-        List[Dict[str, Any]]: Collected documents as dictionaries.
+    Yields:
+        List[Document]: Collected documents, one batch at a time.
     """
-    task_logger = get_run_logger()
-    task_logger.info(f"Collecting data from {source_name} ({source_type})")
-    
     # Create collector
     collector = create_collector(
         source_type=source_type,
@@ -62,32 +149,26 @@ def collect_data_task(
         **source_config
     )
     
-    # Collect documents
-    documents = list(collect_documents(collector, limit=limit))
-    
-    task_logger.info(f"Collected {len(documents)} documents from {source_name}")
-    
-    # Convert to dictionaries for serialization
-    doc_dicts = []
-    for doc in documents:
-        doc_dicts.append({
-            "id": doc.id,
-            "text": doc.text,
-            "metadata": doc.metadata,
-            "source": doc.source,
-            "source_id": doc.source_id
-        })
-    
-    return doc_dicts
+    # Yield batches as documents arrive
+    batch = []
+    for doc in collect_documents(collector, limit=limit):
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+            
+    if batch:
+        yield batch
 
 
 @task(name="process_data_task")
 def process_data_task(
-    documents: List[Dict[str, Any]],
+    documents: List[Document],
     use_default_pipeline: bool = True,
     pipeline_config: Optional[Dict[str, Any]] = None,
-    batch_size: int = 100
-) -> List[Dict[str, Any]]:
+    batch_size: int = 100,
+    workers: int = 1
+) -> List[ProcessedDocument]:
     """Process documents through the processing pipeline.
     
     Args:
@@ -95,73 +176,71 @@ def process_data_task(
         use_default_pipeline: Whether to use the default pipeline.
         pipeline_config: Configuration for a custom pipeline.
         batch_size: Size of batches for processing.
+        workers: Number of worker processes. With more than one, batches
+            are processed in parallel in a process pool, and exact
+            deduplication only applies among documents handled by the
+            same worker.
         
     Returns:
-        List[Dict[str, Any]]: Processed documents as dictionaries.
+        List[ProcessedDocument]: Processed documents.
     """
-    from ..data_collection.base import Document
-    
     task_logger = get_run_logger()
     task_logger.info(f"Processing {len(documents)} documents")
     
-    # Convert dictionaries back to Document objects
-    doc_objects = []
-    for doc_dict in documents:
-        doc = Document(
-            id=doc_dict["id"],
-            text=doc_dict["text"],
-            metadata=doc_dict["metadata"],
-            source=doc_dict["source"],
-            source_id=doc_dict["source_id"]
-        )
-        doc_objects.append(doc)
+    if workers > 1 and len(documents) > batch_size:
+        # Send documents to the workers as plain tuples
+        batches = [
+            [tuple(doc) for doc in documents[i:i + batch_size]]
+            for i in range(0, len(documents), batch_size)
+        ]
+        
+        pool = _get_process_pool(workers)
+        processed_docs = []
+        for processed_batch in pool.map(_process_batch, batches, [batch_size] * len(batches), chunksize=1):
+            processed_docs.extend(processed_batch)
+            
+        task_logger.info(f"Processed {len(processed_docs)} documents with {workers} workers")
+        
+        return processed_docs
     
-    # Create pipeline
+    # Get pipeline
     if use_default_pipeline:
-        pipeline = create_default_pipeline()
+        pipeline = _default_pipeline()
     else:
         # Custom pipeline configuration would be implemented here
-        pipeline = create_default_pipeline()
+        pipeline = _default_pipeline()
     
     # Process documents
     processed_docs = list(process_documents(
-        documents=doc_objects,
+        documents=documents,
         pipeline=pipeline,
         batch_size=batch_size
     ))
     
     task_logger.info(f"Processed {len(processed_docs)} documents")
     
-    # Convert to dictionaries for serialization
-    processed_dicts = []
-    for doc in processed_docs:
-        processed_dicts.append({
-            "id": doc.id,
-            "text": doc.text,
-            "tokens": doc.tokens,
-            "token_count": doc.token_count,
-            "quality_score": doc.quality_score,
-            "quality_metrics": doc.quality_metrics,
-            "source": doc.source,
-            "source_id": doc.source_id,
-            "original_metadata": doc.original_metadata,
-            "enhanced_metadata": doc.enhanced_metadata,
-            "processing_history": doc.processing_history,
-            "processing_metadata": doc.processing_metadata
-        })
-    
-    return processed_dicts
+    return processed_docs
 
 
 @task(name="store_data_task")
 def store_data_task(
-    processed_documents: List[Dict[str, Any]],
+    processed_documents: List[ProcessedDocument],
     mongodb_config: Dict[str, Any],
     raw_storage_config: Dict[str, Any],
     dataset_version: Optional[str] = None
 ) -> Dict[str, Any]:
     """Store processed documents in MongoDB and raw data in cloud storage.
     
+    When storing mapped batches, leave dataset_version unset and tag the
+    version once with create_dataset_version_task after all batches are
+    stored.
+    
+    Setting fast_insert in mongodb_config stores the documents with
+    unacknowledged writes (w=0), for bulk loads where the raw copies are
+    the source of truth. Every document then counts as stored. It is
+    ignored when dataset_version is given, so a version is only ever
+    tagged on acknowledged writes.
+    
     Args:
         processed_documents: Processed documents to store.
         mongodb_config: Configuration for MongoDB storage.
@@ -169,91 +248,79 @@ def store_data_task(
         dataset_version: Optional dataset version name.
         
     Returns:
-        Dict[str, Any]: Storage results.
+        Dict[str, Any]: Storage results, including the number of processed
+            documents received.
     """
-    from ..data_processing.base import ProcessedDocument
-    
     task_logger = get_run_logger()
     task_logger.info(f"Storing {len(processed_documents)} documents")
     
-    # Convert dictionaries back to ProcessedDocument objects
-    doc_objects = []
-    for doc_dict in processed_documents:
-        doc = ProcessedDocument(
-            id=doc_dict["id"],
-            source=doc_dict["source"],
-            source_id=doc_dict["source_id"],
-            text=doc_dict["text"]
-        )
-        doc.tokens = doc_dict.get("tokens")
-        doc.token_count = doc_dict.get("token_count")
-        doc.quality_score = doc_dict.get("quality_score")
-        doc.quality_metrics = doc_dict.get("quality_metrics", {})
-        doc.original_metadata = doc_dict.get("original_metadata", {})
-        doc.enhanced_metadata = doc_dict.get("enhanced_metadata", {})
-        doc.processing_history = doc_dict.get("processing_history", [])
-        doc.processing_metadata = doc_dict.get("processing_metadata", {})
-        doc_objects.append(doc)
-    
-    # Create MongoDB storage
-    mongodb_storage = create_mongodb_storage(
+    # Create MongoDB storage, closed (releasing its shared client) when done
+    with create_mongodb_storage(
         connection_string=mongodb_config["connection_string"],
         database_name=mongodb_config["database_name"],
-        collection_name=mongodb_config["collection_name"]
-    )
-    
-    # Store documents in MongoDB
-    mongodb_results = store_processed_documents(mongodb_storage, doc_objects)
-    
-    # Create raw storage
-    if raw_storage_config["type"] == "s3":
-        raw_storage = create_s3_storage(
-            bucket_name=raw_storage_config["bucket_name"],
-            aws_access_key_id=raw_storage_config.get("aws_access_key_id"),
-            aws_secret_access_key=raw_storage_config.get("aws_secret_access_key"),
-            region_name=raw_storage_config.get("region_name")
-        )
-    else:
-        # Default to local storage
-        raw_storage = create_local_storage(
-            base_dir=raw_storage_config["base_dir"]
-        )
-    
-    # Store raw data
-    raw_results = {}
-    for doc in doc_objects:
-        # Skip documents that failed MongoDB storage
-        if not mongodb_results.get(doc.id, False):
-            continue
-            
-        # Store raw text
-        remote_path = f"raw/{doc.source}/{doc.id}.txt"
-        metadata = {
-            "source": doc.source,
-            "source_id": doc.source_id,
-            "stored_at": datetime.utcnow().isoformat(),
-            "processed": True
-        }
+        collection_name=mongodb_config["collection_name"],
+        batch_size=mongodb_config.get("batch_size", MONGO_BULK_BATCH_SIZE),
+        fast_insert=mongodb_config.get("fast_insert", False) and dataset_version is None
+    ) as mongodb_storage:
+        # Store documents in MongoDB
+        mongodb_results = store_processed_documents(mongodb_storage, processed_documents)
         
-        raw_results[doc.id] = raw_storage.store_text(doc.text, remote_path, metadata)
-    
-    # Create dataset version if requested
-    version_result = None
-    if dataset_version:
-        version_count = mongodb_storage.create_dataset_version(dataset_version)
-        version_result = {
-            "version_name": dataset_version,
-            "document_count": version_count
-        }
-    
+        # Create raw storage
+        if raw_storage_config["type"] == "s3":
+            raw_storage = create_s3_storage(
+                bucket_name=raw_storage_config["bucket_name"],
+                aws_access_key_id=raw_storage_config.get("aws_access_key_id"),
+                aws_secret_access_key=raw_storage_config.get("aws_secret_access_key"),
+                region_name=raw_storage_config.get("region_name")
+            )
+        else:
+            # Default to local storage
+            raw_storage = create_local_storage(
+                base_dir=raw_storage_config["base_dir"]
+            )
+        
+        # Prepare raw data uploads, all stamped with the same batch store time
+        stored_at = datetime.utcnow().isoformat()
+        
+        # Only documents stored in MongoDB get a raw copy
+        successful_ids = {doc_id for doc_id, success in mongodb_results.items() if success}
+        
+        raw_items = [
+            (
+                doc.text,
+                f"raw/{doc.source}/{doc.id}.txt",
+                {
+                    "source": doc.source,
+                    "source_id": doc.source_id,
+                    "stored_at": stored_at,
+                    "processed": True
+                }
+            )
+            for doc in processed_documents
+            if doc.id in successful_ids
+        ]
+        
+        # Store raw texts in one batch (uploaded concurrently for S3)
+        raw_results = store_raw_texts(raw_storage, raw_items)
+        
+        # Create dataset version if requested
+        version_result = None
+        if dataset_version:
+            version_count = mongodb_storage.create_dataset_version(dataset_version)
+            version_result = {
+                "version_name": dataset_version,
+                "document_count": version_count
+            }
+            
     # Compile results
     results = {
+        "processed_count": len(processed_documents),
         "mongodb": {
-            "success_count": sum(1 for success in mongodb_results.values() if success),
+            "success_count": sum(mongodb_results.values()),
             "total_count": len(mongodb_results)
         },
         "raw_storage": {
-            "success_count": sum(1 for success in raw_results.values() if success),
+            "success_count": sum(raw_results.values()),
             "total_count": len(raw_results)
         },
         "dataset_version": version_result
@@ -263,9 +330,41 @@ def store_data_task(
     return results
 
 
+@task(name="create_dataset_version_task")
+def create_dataset_version_task(
+    mongodb_config: Dict[str, Any],
+    dataset_version: str
+) -> Dict[str, Any]:
+    """Tag the stored documents with a dataset version.
+    
+    Args:
+        mongodb_config: Configuration for MongoDB storage.
+        dataset_version: Dataset version name.
+        
+    Returns:
+        Dict[str, Any]: Version name and number of tagged documents.
+    """
+    task_logger = get_run_logger()
+    task_logger.info(f"Creating dataset version {dataset_version}")
+    
+    # Create MongoDB storage, closed (releasing its shared client) when done
+    with create_mongodb_storage(
+        connection_string=mongodb_config["connection_string"],
+        database_name=mongodb_config["database_name"],
+        collection_name=mongodb_config["collection_name"]
+    ) as mongodb_storage:
+        version_count = mongodb_storage.create_dataset_version(dataset_version)
+    
+    return {
+        "version_name": dataset_version,
+        "document_count": version_count
+    }
+
+
 @flow(
     name="llm_data_pipeline",
-    description="LLM Training Data Curation Pipeline"
+    description="LLM Training Data Curation Pipeline",
+    task_runner=ConcurrentTaskRunner()
 )
 def llm_data_pipeline(
     source_config: Dict[str, Any],
@@ -276,9 +375,18 @@ def llm_data_pipeline(
 ) -> Dict[str, Any]:
     """Run the complete LLM training data curation pipeline.
     
+    Collection runs in the flow itself. Each batch is submitted for
+    processing and storage as soon as it is collected, so those task runs
+    overlap with collecting the following batches. Once max_pending_batches
+    batches are in flight, collection waits for the oldest one to be
+    stored, so a fast source can't pile up unprocessed batches in memory.
+    
     Args:
         source_config: Configuration for the data source.
-        processing_config: Configuration for data processing.
+        processing_config: Configuration for data processing. Its
+            task_batch_size (default 1000) sets the number of documents
+            processed and stored by each task run, and max_pending_batches
+            (default 4) the number of batches in flight at a time.
         storage_config: Configuration for data storage.
         limit: Optional maximum number of documents to collect.
         dataset_version: Optional dataset version name.
@@ -289,34 +397,100 @@ def llm_data_pipeline(
     flow_logger = get_run_logger()
     flow_logger.info("Starting LLM data pipeline")
     
-    # Step 1: Collect data
-    documents = collect_data_task(
+    # Unacknowledged writes could still be in flight when the version is
+    # tagged, so a versioned run always waits for its writes
+    mongodb_config = storage_config["mongodb"]
+    if dataset_version and mongodb_config.get("fast_insert"):
+        flow_logger.warning("Ignoring fast_insert because a dataset version is requested")
+        mongodb_config = {**mongodb_config, "fast_insert": False}
+    
+    # Step 1: Collect data in batches
+    flow_logger.info(f"Collecting data from {source_config['name']} ({source_config['type']})")
+    
+    max_pending = processing_config.get("max_pending_batches", 4)
+    
+    # Running totals of the stored batches; their results are dropped once
+    # counted, so memory use doesn't grow with the number of batches
+    totals = {
+        "processed_count": 0,
+        "mongodb_success_count": 0,
+        "mongodb_total_count": 0,
+        "raw_success_count": 0,
+        "raw_total_count": 0
+    }
+    
+    def add_batch_result(storage_future) -> None:
+        result = storage_future.result()
+        totals["processed_count"] += result["processed_count"]
+        totals["mongodb_success_count"] += result["mongodb"]["success_count"]
+        totals["mongodb_total_count"] += result["mongodb"]["total_count"]
+        totals["raw_success_count"] += result["raw_storage"]["success_count"]
+        totals["raw_total_count"] += result["raw_storage"]["total_count"]
+    
+    collected_count = 0
+    batch_count = 0
+    pending = deque()
+    for batch in _iter_document_batches(
         source_type=source_config["type"],
         source_name=source_config["name"],
         source_config=source_config["config"],
-        limit=limit
-    )
+        limit=limit,
+        batch_size=processing_config.get("task_batch_size", 1000)
+    ):
+        collected_count += len(batch)
+        batch_count += 1
+        flow_logger.info(f"Collected batch {batch_count} ({collected_count} documents so far)")
+        
+        # Step 2: Process the batch in its own task run
+        processed_future = process_data_task.submit(
+            batch,
+            use_default_pipeline=processing_config.get("use_default_pipeline", True),
+            pipeline_config=processing_config.get("pipeline_config"),
+            batch_size=processing_config.get("batch_size", 100),
+            workers=processing_config.get("workers", 1)
+        )
+        
+        # Step 3: Store the batch as soon as it has been processed
+        pending.append(store_data_task.submit(
+            processed_future,
+            mongodb_config=mongodb_config,
+            raw_storage_config=storage_config["raw_storage"]
+        ))
+        
+        # Wait for the oldest batch before collecting more
+        if len(pending) >= max_pending:
+            add_batch_result(pending.popleft())
+            
+    flow_logger.info(f"Collected {collected_count} documents in {batch_count} batches")
     
-    # Step 2: Process data
-    processed_documents = process_data_task(
-        documents=documents,
-        use_default_pipeline=processing_config.get("use_default_pipeline", True),
-        pipeline_config=processing_config.get("pipeline_config"),
-        batch_size=processing_config.get("batch_size", 100)
-    )
+    while pending:
+        add_batch_result(pending.popleft())
     
-    # Step 3: Store data
-    storage_results = store_data_task(
-        processed_documents=processed_documents,
-        mongodb_config=storage_config["mongodb"],
-        raw_storage_config=storage_config["raw_storage"],
-        dataset_version=dataset_version
-    )
+    # Step 4: Create dataset version once all batches are stored
+    version_result = None
+    if dataset_version:
+        version_result = create_dataset_version_task(
+            mongodb_config=mongodb_config,
+            dataset_version=dataset_version
+        )
+        
+    # Combine batch storage results
+    storage_results = {
+        "mongodb": {
+            "success_count": totals["mongodb_success_count"],
+            "total_count": totals["mongodb_total_count"]
+        },
+        "raw_storage": {
+            "success_count": totals["raw_success_count"],
+            "total_count": totals["raw_total_count"]
+        },
+        "dataset_version": version_result
+    }
     
     # Compile results
     results = {
-        "collected_count": len(documents),
-        "processed_count": len(processed_documents),
+        "collected_count": collected_count,
+        "processed_count": totals["processed_count"],
         "storage_results": storage_results,
         "completed_at": datetime.utcnow().isoformat()
     }
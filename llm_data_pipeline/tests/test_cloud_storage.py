@@ -0,0 +1,273 @@
+"""
+Test script for the cloud storage module.
+
+This script checks LocalStorage against temporary directories and
+S3Storage against a stub client, so it needs neither network access nor
+AWS credentials.
+"""
+
+import hashlib
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the project root to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.data_storage import cloud
+from src.data_storage.cloud import INLINE_METADATA_PREFIX, S3_DELETE_BATCH_SIZE, AsyncS3Storage, LocalStorage, S3Storage
+
+
+class StubS3Client:
+    """S3 client stub recording DeleteObjects requests."""
+    
+    def __init__(self, failed_keys=()):
+        self.failed_keys = set(failed_keys)
+        self.delete_requests = []
+        
+    def delete_objects(self, Bucket, Delete):
+        keys = [obj["Key"] for obj in Delete["Objects"]]
+        self.delete_requests.append(keys)
+        return {
+            "Errors": [
+                {"Key": key, "Code": "AccessDenied"}
+                for key in keys if key in self.failed_keys
+            ]
+        }
+
+
+def test_inline_metadata_round_trip():
+    """Test that every LocalStorage operation handles inline metadata headers."""
+    print("Testing LocalStorage inline metadata round trip...")
+    
+    text = "First line of the opinion.\nSecond line, with a section sign § 12.\n"
+    data = b"\x00\x01binary\ncontent\xff"
+    metadata = {"court": "Supreme Court"}
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = LocalStorage(Path(temp_dir) / "storage", inline_metadata=True)
+        assert storage.connect()
+        
+        source_file = Path(temp_dir) / "source.bin"
+        source_file.write_bytes(data)
+        
+        assert storage.store_text(text, "docs/text.txt", metadata)
+        assert storage.store_bytes(data, "docs/bytes.bin", metadata)
+        assert storage.store_file(source_file, "docs/file.bin")
+        
+        # Metadata is stored in a header line, never in a sidecar file
+        for remote_path, expected in (
+            ("docs/text.txt", metadata),
+            ("docs/bytes.bin", metadata),
+            ("docs/file.bin", {})
+        ):
+            full_path = storage.base_dir / remote_path
+            header = full_path.read_bytes().split(b"\n", 1)[0]
+            assert header.startswith(INLINE_METADATA_PREFIX)
+            assert json.loads(header[len(INLINE_METADATA_PREFIX):]) == expected
+            assert not Path(str(full_path) + ".metadata").exists()
+        
+        # Reads only return the content after the header
+        assert storage.get_text("docs/text.txt") == text
+        assert storage.get_digest("docs/text.txt") == hashlib.sha256(text.encode("utf-8")).digest()
+        assert storage.get_digest("docs/bytes.bin") == hashlib.sha256(data).digest()
+        
+        for remote_path, expected in (
+            ("docs/text.txt", text.encode("utf-8")),
+            ("docs/bytes.bin", data),
+            ("docs/file.bin", data)
+        ):
+            retrieved_file = Path(temp_dir) / "retrieved" / remote_path
+            assert storage.get_file(remote_path, retrieved_file)
+            print(f"  {remote_path}: {retrieved_file.stat().st_size} bytes")
+            assert retrieved_file.read_bytes() == expected
+        
+        assert sorted(storage.list_files("docs/")) == ["docs/bytes.bin", "docs/file.bin", "docs/text.txt"]
+        
+        for remote_path in ("docs/text.txt", "docs/bytes.bin", "docs/file.bin"):
+            assert storage.delete_file(remote_path)
+        
+        assert storage.list_files("docs/") == []
+
+
+def test_iter_files_prefix():
+    """Test that iter_files matches prefixes like S3 key prefixes."""
+    print("Testing LocalStorage.iter_files prefixes...")
+    
+    paths = [
+        "docs/a.txt",
+        "docs/ab.txt",
+        "docs/b.txt",
+        "docs/sub/c.txt",
+        "docs2/d.txt",
+        "doc.txt",
+        "other/e.txt"
+    ]
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = LocalStorage(temp_dir)
+        assert storage.connect()
+        
+        for remote_path in paths:
+            assert storage.store_text(remote_path, remote_path, {"path": remote_path})
+            
+        for prefix, expected in (
+            ("", paths),
+            ("docs/", ["docs/a.txt", "docs/ab.txt", "docs/b.txt", "docs/sub/c.txt"]),
+            ("docs", ["docs/a.txt", "docs/ab.txt", "docs/b.txt", "docs/sub/c.txt", "docs2/d.txt"]),
+            ("doc", paths[:-1]),
+            ("docs/a", ["docs/a.txt", "docs/ab.txt"]),
+            ("docs/sub", ["docs/sub/c.txt"]),
+            ("docs/a.txt", ["docs/a.txt"]),
+            ("missing/", []),
+            ("missing", [])
+        ):
+            files = sorted(storage.iter_files(prefix))
+            print(f"  {prefix!r}: {files}")
+            # Metadata sidecar files are never listed
+            assert files == sorted(expected)
+
+
+def test_get_digest():
+    """Test that get_digest hashes the stored content."""
+    print("Testing LocalStorage.get_digest...")
+    
+    text = "Text with a section sign § 12.\nSecond line.\n"
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = LocalStorage(temp_dir)
+        assert storage.connect()
+        
+        assert storage.store_text(text, "docs/text.txt", {"court": "Supreme Court"})
+        assert storage.store_bytes(b"", "docs/empty.bin")
+        
+        # Chunk sizes below, at and above the content size
+        for chunk_size in (1, 7, 64 * 1024):
+            digest = storage.get_digest("docs/text.txt", chunk_size=chunk_size)
+            assert digest == hashlib.sha256(Path(temp_dir, "docs", "text.txt").read_bytes()).digest()
+            
+        assert storage.get_digest("docs/empty.bin") == hashlib.sha256(b"").digest()
+        assert storage.get_digest("docs/missing.txt") is None
+
+
+def test_store_texts():
+    """Test storing multiple texts in new directories."""
+    print("Testing LocalStorage.store_texts...")
+    
+    items = [
+        ("First text.", "a/first.txt", {"index": "1"}),
+        ("Second text.", "a/b/second.txt", None),
+        ("Third text.", "c/third.txt", {"index": "3"})
+    ]
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = LocalStorage(temp_dir)
+        assert storage.connect()
+        
+        results = storage.store_texts(items)
+        print(f"  {results}")
+        assert results == {remote_path: True for _, remote_path, _ in items}
+        
+        for text, remote_path, metadata in items:
+            assert storage.get_text(remote_path) == text
+            
+            metadata_path = Path(temp_dir, remote_path + ".metadata")
+            if metadata:
+                assert json.loads(metadata_path.read_text()) == metadata
+            else:
+                assert not metadata_path.exists()
+                
+        # A file where a directory is needed fails only its own items
+        results = storage.store_texts([
+            ("Blocked.", "a/first.txt/blocked.txt", None),
+            ("Allowed.", "c/allowed.txt", None)
+        ])
+        print(f"  {results}")
+        assert results == {"a/first.txt/blocked.txt": False, "c/allowed.txt": True}
+
+
+def test_s3_delete_files_batching():
+    """Test that S3 deletes are sent in DeleteObjects batches."""
+    print("Testing S3Storage.delete_files batching...")
+    
+    storage = S3Storage("test-bucket")
+    
+    # A single request for up to one batch
+    client = StubS3Client(failed_keys={"key-3"})
+    storage.s3_client = client
+    
+    keys = [f"key-{i}" for i in range(5)]
+    results = storage.delete_files(iter(keys))
+    assert client.delete_requests == [keys]
+    assert results == {key: key != "key-3" for key in keys}
+    
+    # Larger deletes are split into batches of at most S3_DELETE_BATCH_SIZE
+    client = StubS3Client(failed_keys={"key-0", "key-1500"})
+    storage.s3_client = client
+    
+    keys = [f"key-{i}" for i in range(2 * S3_DELETE_BATCH_SIZE + 1)]
+    results = storage.delete_files(keys)
+    print(f"  Request sizes: {[len(request) for request in client.delete_requests]}")
+    assert sorted(len(request) for request in client.delete_requests) == [1, S3_DELETE_BATCH_SIZE, S3_DELETE_BATCH_SIZE]
+    assert sorted(key for request in client.delete_requests for key in request) == sorted(keys)
+    assert results == {key: key not in ("key-0", "key-1500") for key in keys}
+    
+    assert storage.delete_files([]) == {}
+
+
+def test_async_s3_storage_import_guard():
+    """Test that AsyncS3Storage reports a missing aioboto3 when created."""
+    print("Testing AsyncS3Storage without aioboto3...")
+    
+    # Like S3Storage, files are listed lazily with iter_files
+    assert hasattr(AsyncS3Storage, "iter_files")
+    assert not hasattr(AsyncS3Storage, "list_files")
+    
+    aioboto3 = cloud.aioboto3
+    cloud.aioboto3 = None
+    try:
+        AsyncS3Storage("test-bucket")
+    except ImportError as e:
+        print(f"  Raised ImportError: {e}")
+    else:
+        raise AssertionError("AsyncS3Storage was created without aioboto3")
+    finally:
+        cloud.aioboto3 = aioboto3
+
+
+def main():
+    """Run all tests."""
+    tests = [
+        ("Inline metadata round trip", test_inline_metadata_round_trip),
+        ("LocalStorage.iter_files prefixes", test_iter_files_prefix),
+        ("LocalStorage.get_digest", test_get_digest),
+        ("LocalStorage.store_texts", test_store_texts),
+        ("S3 delete batching", test_s3_delete_files_batching),
+        ("AsyncS3Storage import guard", test_async_s3_storage_import_guard)
+    ]
+    
+    success = True
+    
+    for name, test in tests:
+        try:
+            test()
+            print(f"\n{name} test: PASSED")
+        except Exception as e:
+            print(f"\n{name} test: FAILED - {e!r}")
+            success = False
+        
+        print("\n" + "-" * 50 + "\n")
+    
+    # Print overall result
+    print("=" * 50)
+    if success:
+        print("All tests PASSED")
+    else:
+        print("Some tests FAILED")
+    
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""
+Test script for the document classes.
+
+This script checks the conversions of collected and processed documents
+to and from the dictionaries used for storage.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.data_collection.base import Document
+from src.data_processing.base import ProcessedDocument
+
+
+def test_document_to_dict():
+    """Test that a document converts to a dictionary of all its fields."""
+    print("Testing Document.to_dict...")
+    
+    metadata = {"court": "Supreme Court", "year": 2020}
+    document = Document(
+        id="doc1",
+        text="This is a sample legal document.",
+        metadata=metadata,
+        source="test",
+        source_id="source-1"
+    )
+    
+    doc_dict = document.to_dict()
+    print(f"  {doc_dict}")
+    assert doc_dict == {
+        "id": "doc1",
+        "text": "This is a sample legal document.",
+        "metadata": metadata,
+        "source": "test",
+        "source_id": "source-1"
+    }
+    assert Document(**doc_dict) == document
+
+
+def test_processed_document_from_mongo():
+    """Test creating processed documents from stored MongoDB documents."""
+    print("Testing ProcessedDocument.from_mongo...")
+    
+    # A fully populated document, with the MongoDB-only _id field
+    stored = {
+        "_id": "object-id",
+        "id": "doc1",
+        "source": "test",
+        "source_id": "source-1",
+        "text": "The court held.",
+        "tokens": ["The", "court", "held", "."],
+        "token_count": 4,
+        "quality_score": 0.9,
+        "quality_metrics": {"length": 1.0},
+        "metadata": {"pipeline": "default"},
+        "original_metadata": {"court": "Supreme Court"},
+        "enhanced_metadata": {"citations": []},
+        "processing_history": ["initial_import", "cleaning"]
+    }
+    
+    doc = ProcessedDocument.from_mongo(stored)
+    assert doc == ProcessedDocument(
+        id="doc1",
+        source="test",
+        source_id="source-1",
+        text="The court held.",
+        tokens=["The", "court", "held", "."],
+        token_count=4,
+        quality_score=0.9,
+        quality_metrics={"length": 1.0},
+        processing_metadata={"pipeline": "default"},
+        original_metadata={"court": "Supreme Court"},
+        enhanced_metadata={"citations": []},
+        processing_history=["initial_import", "cleaning"]
+    )
+    
+    # Missing and null optional fields get the dataclass defaults
+    for stored in (
+        {"id": "doc2", "source": "test", "source_id": "source-2", "text": "Text."},
+        {
+            "id": "doc2", "source": "test", "source_id": "source-2", "text": "Text.",
+            "quality_metrics": None, "metadata": None, "original_metadata": None,
+            "enhanced_metadata": None, "processing_history": None
+        }
+    ):
+        doc = ProcessedDocument.from_mongo(stored)
+        print(f"  {doc}")
+        assert doc == ProcessedDocument(id="doc2", source="test", source_id="source-2", text="Text.")
+    
+    # Default containers are not shared between documents
+    first = ProcessedDocument.from_mongo(stored)
+    second = ProcessedDocument.from_mongo(stored)
+    first.processing_history.append("cleaning")
+    assert second.processing_history == []
+
+
+def main():
+    """Run all tests."""
+    tests = [
+        ("Document.to_dict", test_document_to_dict),
+        ("ProcessedDocument.from_mongo", test_processed_document_from_mongo)
+    ]
+    
+    success = True
+    
+    for name, test in tests:
+        try:
+            test()
+            print(f"\n{name} test: PASSED")
+        except Exception as e:
+            print(f"\n{name} test: FAILED - {e!r}")
+            success = False
+        
+        print("\n" + "-" * 50 + "\n")
+    
+    # Print overall result
+    print("=" * 50)
+    if success:
+        print("All tests PASSED")
+    else:
+        print("Some tests FAILED")
+    
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
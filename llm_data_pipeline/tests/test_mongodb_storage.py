@@ -0,0 +1,317 @@
+"""
+Test script for the MongoDB storage module.
+
+This script checks token packing and the round trip of documents through
+MongoDB. Tests that need a MongoDB server are skipped when none is
+available; bulk writes and write buffering are checked against a fake
+collection.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from pymongo.errors import BulkWriteError
+
+# Add the project root to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.data_processing.base import ProcessedDocument
+from src.data_storage import mongodb
+from src.data_storage.mongodb import MongoDBStorage, _bulk_write, _pack_tokens, unpack_tokens
+
+
+# Local MongoDB instance; fail fast when no server is running
+MONGODB_URI = "mongodb://localhost:27017/?serverSelectionTimeoutMS=2000"
+
+# Connection string for storage backed by a fake client
+FAKE_URI = "mongodb://fake-host:27017/"
+
+
+class FakeCollection:
+    """Collection that records bulk writes, optionally raising an error."""
+    
+    def __init__(self, error=None, write_concern=None):
+        self.error = error
+        self.write_concern = write_concern
+        self.bulk_writes = []
+        
+    def with_options(self, write_concern=None):
+        return FakeCollection(self.error, write_concern)
+        
+    def bulk_write(self, operations, ordered=True):
+        self.bulk_writes.append((operations, ordered))
+        if self.error is not None:
+            raise self.error
+            
+            
+class FakeClient:
+    """Client serving a single fake collection from any database."""
+    
+    def __init__(self, collection):
+        self.admin = mock.Mock()
+        self.collection = collection
+        self.closed = False
+        
+    def __getitem__(self, database_name):
+        return {"mongodb_storage_test": self.collection}
+        
+    def close(self):
+        self.closed = True
+
+
+def connect_or_skip(**kwargs):
+    """Connect to the test collection, skipping the test if MongoDB is unavailable."""
+    storage = MongoDBStorage(
+        connection_string=MONGODB_URI,
+        database_name="llm_data_pipeline_test",
+        collection_name="mongodb_storage_test",
+        **kwargs
+    )
+    
+    if not storage.connect():
+        raise unittest.SkipTest("MongoDB is not available")
+    
+    return storage
+
+
+def connect_fake(collection, **kwargs):
+    """Create storage whose connection uses a fake client for the collection."""
+    client = FakeClient(collection)
+    with mock.patch.object(mongodb, "_create_client", return_value=client):
+        storage = MongoDBStorage(
+            connection_string=FAKE_URI,
+            database_name="llm_data_pipeline_test",
+            collection_name="mongodb_storage_test",
+            create_indexes=False,
+            **kwargs
+        )
+        assert storage.connect()
+        
+    return storage, client
+
+
+def make_document(document_id, tokens, text="Sample text for storage tests."):
+    """Create a processed document with the given tokens."""
+    return ProcessedDocument(
+        id=document_id,
+        source="test",
+        source_id=document_id,
+        text=text,
+        tokens=tokens,
+        token_count=len(tokens) if tokens is not None else None
+    )
+
+
+def test_pack_tokens():
+    """Test that packed tokens unpack to the original tokens."""
+    print("Testing token packing...")
+    
+    for tokens in (["The", "court", "held", "."], ["single"], [""], [], None):
+        packed = _pack_tokens(tokens)
+        print(f"  {tokens!r} -> {packed!r}")
+        assert unpack_tokens(packed) == tokens
+    
+    # Tokens that can't be packed are left as a list
+    unpackable = ["a\x00b", "c"]
+    assert _pack_tokens(unpackable) == unpackable
+    assert unpack_tokens(unpackable) == unpackable
+    assert _pack_tokens([1, 2]) == [1, 2]
+
+
+def test_packed_tokens_round_trip():
+    """Test storing packed tokens and reading them back with iter_documents."""
+    print("Testing packed token round trip through MongoDB...")
+    
+    documents = [
+        make_document("pack-list", ["The", "court", "held", "."]),
+        make_document("pack-empty", []),
+        make_document("pack-none", None)
+    ]
+    document_ids = [document.id for document in documents]
+    
+    with connect_or_skip(pack_tokens=True) as storage:
+        storage.collection.delete_many({"id": {"$in": document_ids}})
+        
+        try:
+            results = storage.store_documents(documents)
+            assert all(results.values())
+            
+            # Only the non-empty token list is stored packed
+            stored = {doc["id"]: doc["tokens"] for doc in storage.collection.find({"id": {"$in": document_ids}})}
+            assert stored == {
+                "pack-list": "The\x00court\x00held\x00.",
+                "pack-empty": [],
+                "pack-none": None
+            }
+            for document in documents:
+                assert unpack_tokens(stored[document.id]) == document.tokens
+            
+            retrieved = {doc.id: doc for doc in storage.iter_documents({"id": {"$in": document_ids}})}
+            for document in documents:
+                print(f"  {document.id}: {retrieved[document.id].tokens!r}")
+                assert retrieved[document.id].tokens == document.tokens
+        
+        finally:
+            storage.collection.delete_many({"id": {"$in": document_ids}})
+
+
+def test_bulk_write_errors():
+    """Test that bulk write errors are mapped back to their documents."""
+    print("Testing bulk write error mapping...")
+    
+    document_ids = ["doc1", "doc2", "doc3"]
+    updates = [{"$set": {"text": document_id}} for document_id in document_ids]
+    
+    # Every document succeeds in an unordered bulk upsert
+    collection = FakeCollection()
+    assert _bulk_write(collection, document_ids, updates) == dict.fromkeys(document_ids, True)
+    operations, ordered = collection.bulk_writes[0]
+    assert not ordered
+    assert [operation._filter for operation in operations] == [{"id": document_id} for document_id in document_ids]
+    assert all(operation._upsert for operation in operations)
+    
+    # Write errors only fail the documents at their indexes
+    collection = FakeCollection(BulkWriteError({
+        "writeErrors": [{"index": 1, "code": 11000, "errmsg": "duplicate key"}],
+        "writeConcernErrors": []
+    }))
+    results = _bulk_write(collection, document_ids, updates)
+    print(f"  Write error: {results}")
+    assert results == {"doc1": True, "doc2": False, "doc3": True}
+    
+    # A write concern error fails the whole batch
+    collection = FakeCollection(BulkWriteError({
+        "writeErrors": [{"index": 1, "code": 11000, "errmsg": "duplicate key"}],
+        "writeConcernErrors": [{"code": 64, "errmsg": "waiting for replication timed out"}]
+    }))
+    results = _bulk_write(collection, document_ids, updates)
+    print(f"  Write concern error: {results}")
+    assert results == dict.fromkeys(document_ids, False)
+    
+    # So does any other error
+    collection = FakeCollection(RuntimeError("connection reset"))
+    assert _bulk_write(collection, document_ids, updates) == dict.fromkeys(document_ids, False)
+
+
+def test_buffered_writes():
+    """Test buffering single-document writes into bulk writes."""
+    print("Testing buffered document writes...")
+    
+    collection = FakeCollection()
+    storage, client = connect_fake(collection, batch_size=3)
+    
+    try:
+        # Storing a document again before a flush replaces its write
+        assert storage.store_document(make_document("doc1", ["first"], text="First version."))
+        assert storage.store_document(make_document("doc2", ["second"]))
+        assert storage.store_document(make_document("doc1", ["third"], text="Second version."))
+        assert collection.bulk_writes == []
+        
+        assert storage.flush() == {"doc1": True, "doc2": True}
+        operations, ordered = collection.bulk_writes[0]
+        assert not ordered
+        assert [operation._filter for operation in operations] == [{"id": "doc1"}, {"id": "doc2"}]
+        assert operations[0]._doc["$set"]["text"] == "Second version."
+        assert operations[0]._doc["$setOnInsert"] == {"id": "doc1", "source": "test", "source_id": "doc1"}
+        
+        # Nothing is left to flush
+        assert storage.flush() == {}
+        assert len(collection.bulk_writes) == 1
+        
+        # A full buffer is flushed by the write that fills it
+        for document_id in ("doc3", "doc4", "doc5"):
+            assert storage.store_document(make_document(document_id, []))
+        assert len(collection.bulk_writes) == 2
+        assert len(collection.bulk_writes[1][0]) == 3
+        
+    finally:
+        storage.close()
+        
+    assert client.closed
+    
+    # Leaving a with block flushes the buffer and closes the client
+    collection = FakeCollection()
+    with mock.patch.object(mongodb, "_create_client", return_value=FakeClient(collection)):
+        with MongoDBStorage(FAKE_URI, "llm_data_pipeline_test", "mongodb_storage_test", create_indexes=False) as storage:
+            assert storage.store_document(make_document("doc6", []))
+            assert collection.bulk_writes == []
+            
+    print(f"  Flushed on exit: {[operation._filter for operation in collection.bulk_writes[0][0]]}")
+    assert len(collection.bulk_writes) == 1
+    assert storage.client is None
+
+
+def test_fast_insert_write_concern():
+    """Test that fast_insert only makes document stores unacknowledged."""
+    print("Testing fast_insert write concern...")
+    
+    collection = FakeCollection()
+    storage, _ = connect_fake(collection, fast_insert=True)
+    
+    try:
+        # Other operations keep the acknowledged collection
+        assert storage.collection is collection
+        write_collection = storage._write_collection
+        assert write_collection is not collection
+        assert write_collection.write_concern.document == {"w": 0}
+        
+        assert storage.store_documents([make_document("doc1", [])]) == {"doc1": True}
+        assert storage.store_document(make_document("doc2", []))
+        assert storage.flush() == {"doc2": True}
+        assert len(write_collection.bulk_writes) == 2
+        assert collection.bulk_writes == []
+        
+    finally:
+        storage.close()
+        
+    # Without fast_insert, documents are stored through the same collection
+    collection = FakeCollection()
+    storage, _ = connect_fake(collection)
+    
+    try:
+        assert storage._write_collection is collection
+        assert storage.store_documents([make_document("doc1", [])]) == {"doc1": True}
+        assert len(collection.bulk_writes) == 1
+        
+    finally:
+        storage.close()
+
+
+def main():
+    """Run all tests."""
+    tests = [
+        ("Token packing", test_pack_tokens),
+        ("Packed token round trip", test_packed_tokens_round_trip),
+        ("Bulk write errors", test_bulk_write_errors),
+        ("Buffered writes", test_buffered_writes),
+        ("fast_insert write concern", test_fast_insert_write_concern)
+    ]
+    
+    success = True
+    
+    for name, test in tests:
+        try:
+            test()
+            print(f"\n{name} test: PASSED")
+        except unittest.SkipTest as e:
+            print(f"\n{name} test: SKIPPED ({e})")
+        except Exception as e:
+            print(f"\n{name} test: FAILED - {e!r}")
+            success = False
+        
+        print("\n" + "-" * 50 + "\n")
+    
+    # Print overall result
+    print("=" * 50)
+    if success:
+        print("All available tests PASSED")
+    else:
+        print("Some tests FAILED")
+    
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
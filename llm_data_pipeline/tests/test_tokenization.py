@@ -0,0 +1,88 @@
+"""
+Test script for the tokenization processors.
+
+This script checks that batch sentence tokenization in WordTokenizer gives
+the same tokens as tokenizing each sentence on its own.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nltk.tokenize import word_tokenize
+
+from src.data_processing.tokenization import WordTokenizer
+
+
+# Sentences as produced by SentenceTokenizer, including ones whose start or
+# end the word tokenizer treats specially
+PARITY_SENTENCES = [
+    "The Court held that under 42 U.S.C. § 1983, plaintiffs must show intent.",
+    "See Smith v. Jones, 123 U.S. 456 (1990).",
+    "Mr. Smith disagreed... \"Why?\" he asked.",
+    "\"The statute is clear,\" the court wrote.",
+    "It wasn't the defendant's fault.",
+    "The appeal was denied (see above).",
+    "The court called it \"frivolous.\"",
+    "The clerk wrote 'denied.'",
+    "These are the defendants'",
+    "''Quoted'' at the start.",
+    "He said. \"",
+    "Unicode “quotes.”",
+    "Pursuant to Section 230:",
+    "The fee was $5.00.",
+    "Trailing spaces.   ",
+    "No final punctuation",
+    ""
+]
+
+def test_tokenize_sentences_parity():
+    """Test that batch sentence tokenization matches per-sentence tokenization."""
+    print("Testing batch word tokenization parity...")
+    
+    tokenizer = WordTokenizer()
+    
+    # Each sentence both first, in the middle and last in the batch
+    for sentences in (PARITY_SENTENCES, PARITY_SENTENCES[::-1], PARITY_SENTENCES[1:] + PARITY_SENTENCES[:1]):
+        batched = tokenizer._tokenize_sentences(sentences)
+        
+        assert len(batched) == len(sentences)
+        for sentence, tokens in zip(sentences, batched):
+            expected = word_tokenize(sentence, preserve_line=True)
+            assert tokens == expected, f"{sentence!r}: {tokens} != {expected}"
+    
+    print(f"  {len(PARITY_SENTENCES)} sentences tokenized identically")
+
+
+def main():
+    """Run all tests."""
+    tests = [
+        ("Batch word tokenization parity", test_tokenize_sentences_parity)
+    ]
+    
+    success = True
+    
+    for name, test in tests:
+        try:
+            test()
+            print(f"\n{name} test: PASSED")
+        except Exception as e:
+            print(f"\n{name} test: FAILED - {e!r}")
+            success = False
+        
+        print("\n" + "-" * 50 + "\n")
+    
+    # Print overall result
+    print("=" * 50)
+    if success:
+        print("All tests PASSED")
+    else:
+        print("Some tests FAILED")
+    
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
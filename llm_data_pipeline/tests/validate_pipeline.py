@@ -8,14 +8,19 @@ from data collection to storage and analysis.
 import os
 import sys
 import json
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 
 # Add the project root to the Python path
-project_root = Path(__file__).parent.parent
-sys.path.append(str(project_root))
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.append(str(project_root))
 
+from src.data_collection.base import Document
 from src.data_collection.main import create_collector, collect_sample
 from src.data_processing.main import create_default_pipeline, process_sample
 from src.data_storage.main import create_mongodb_storage, create_local_storage
@@ -30,44 +35,93 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Paths used by the validation stages
+SOURCE_DIR = project_root / "src"
+SAMPLE_DIR = project_root / "data" / "samples"
+STORAGE_DIR = project_root / "data" / "validation_storage"
+VALIDATION_CACHE_FILE = project_root / "data" / "validation_cache.json"
 
+# Environment variables that change what the validated pipeline connects to
+CACHE_ENV_VARS = ("MONGODB_URI", "DATABASE_URL", "S3_WORKERS")
+
+# Validation stages that can be skipped on incremental runs, and the
+# validation results each one covers
+CACHED_STAGES = {
+    "components": ("data_collection", "data_processing", "data_storage"),
+    "orchestration": ("orchestration",)
+}
+
+
+def create_sample_documents():
+    """Create the sample documents used for validation."""
+    # 10 sample documents
+    return [
+        {
+            "id": f"sample-{i+1}",
+            "text": f"This is a sample legal document {i+1} for validation testing. "
+                   f"The case of Smith v. Jones, 123 U.S. 456 (2020), established an important precedent. "
+                   f"The Court held that under 42 U.S.C. § 1983, plaintiffs must show...",
+            "court": "Supreme Court",
+            "year": 2020 + (i % 5)
+        }
+        for i in range(10)
+    ]
+
+
+@lru_cache(maxsize=1)
 def create_sample_data():
-    """Create sample data for validation."""
+    """Create sample data for validation.
+    
+    The file name contains a hash of the sample documents, so the file is
+    only written again when the documents change. Sample files for other
+    versions of the documents are removed.
+    """
     logger.info("Creating sample data for validation")
     
     # Create sample directory
-    sample_dir = project_root / "data" / "samples"
-    sample_dir.mkdir(parents=True, exist_ok=True)
+    SAMPLE_DIR.mkdir(parents=True, exist_ok=True)
     
-    # Create a sample JSONL file
-    sample_file = sample_dir / "validation_sample.jsonl"
+    # Create a sample JSONL file named after its content
+    payload = "\n".join(json.dumps(doc) for doc in create_sample_documents()) + "\n"
+    sample_hash = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+    sample_file = SAMPLE_DIR / f"validation_sample_{sample_hash}.jsonl"
     
-    # Create sample data if it doesn't exist
+    # Create sample data if it doesn't exist, in a single write
     if not sample_file.exists():
-        logger.info(f"Creating sample file: {sample_file}")
-        with open(sample_file, 'w') as f:
-            # Add 10 sample documents
-            for i in range(10):
-                doc = {
-                    "id": f"sample-{i+1}",
-                    "text": f"This is a sample legal document {i+1} for validation testing. "
-                           f"The case of Smith v. Jones, 123 U.S. 456 (2020), established an important precedent. "
-                           f"The Court held that under 42 U.S.C. § 1983, plaintiffs must show...",
-                    "court": "Supreme Court",
-                    "year": 2020 + (i % 5)
-                }
-                f.write(json.dumps(doc) + "\n")
+        logger.info("Creating sample file: %s", sample_file)
+        sample_file.write_text(payload, encoding="utf-8")
+        
+    # Remove sample files left behind by earlier versions of the documents
+    for stale_file in SAMPLE_DIR.glob("validation_sample_*.jsonl"):
+        if stale_file != sample_file:
+            logger.info("Removing stale sample file: %s", stale_file)
+            stale_file.unlink(missing_ok=True)
     
     return sample_file
 
 
-def validate_data_collection():
+@lru_cache(maxsize=1)
+def get_pipeline():
+    """Get the default processing pipeline, created once per process."""
+    return create_default_pipeline()
+
+
+def warm_up_pipeline():
+    """Process one document so the pipeline's lazily loaded resources are ready."""
+    document = Document(
+        id="warmup",
+        text="This is a warm-up document. It loads the tokenizer models. It is not stored.",
+        metadata={},
+        source="validation_warmup",
+        source_id="warmup"
+    )
+    process_sample([document], sample_size=1, pipeline=get_pipeline())
+
+
+def validate_data_collection(sample_file):
     """Validate the data collection module."""
     logger.info("Validating data collection module")
     
-    # Create sample data
-    sample_file = create_sample_data()
-    
     # Create a collector for the sample file
     collector = create_collector(
         source_type="generic_jsonl",
@@ -79,12 +133,13 @@ def validate_data_collection():
     # Collect sample documents
     documents = collect_sample(collector, sample_size=5)
     
-    # Validate results
+    # Validate results, checking each document in a single pass
     assert len(documents) > 0, "No documents collected"
-    assert all(doc.id for doc in documents), "Documents missing IDs"
-    assert all(doc.text for doc in documents), "Documents missing text"
+    for doc in documents:
+        assert doc.id, "Documents missing IDs"
+        assert doc.text, "Documents missing text"
     
-    logger.info(f"Successfully collected {len(documents)} documents")
+    logger.info("Successfully collected %d documents", len(documents))
     return documents
 
 
@@ -92,18 +147,20 @@ def validate_data_processing(documents):
     """Validate the data processing module."""
     logger.info("Validating data processing module")
     
-    # Create default processing pipeline
-    pipeline = create_default_pipeline()
+    # Get default processing pipeline
+    pipeline = get_pipeline()
     
     # Process the sample documents
     processed_docs = process_sample(documents, sample_size=5, pipeline=pipeline)
     
-    # Validate results
+    # Validate results, checking each document in a single pass
     assert len(processed_docs) > 0, "No documents processed"
-    assert all(doc.quality_score is not None for doc in processed_docs), "Documents missing quality scores"
-    assert all(doc.token_count > 0 for doc in processed_docs), "Documents have no tokens"
+    for doc in processed_docs:
+        assert doc.quality_score is not None, "Documents missing quality scores"
+        assert doc.token_count > 0, "Documents have no tokens"
+        assert "Smith v. Jones, 123 U.S. 456" in doc.text, "Documents lost the sample citation"
     
-    logger.info(f"Successfully processed {len(processed_docs)} documents")
+    logger.info("Successfully processed %d documents", len(processed_docs))
     return processed_docs
 
 
@@ -112,45 +169,61 @@ def validate_data_storage(processed_docs):
     logger.info("Validating data storage module")
     
     # Create local storage for testing
-    storage_dir = project_root / "data" / "validation_storage"
-    storage_dir.mkdir(parents=True, exist_ok=True)
+    STORAGE_DIR.mkdir(parents=True, exist_ok=True)
     
-    local_storage = create_local_storage(storage_dir)
+    local_storage = create_local_storage(STORAGE_DIR)
     
-    # Store a sample document
+    # Store the sample documents
     if processed_docs:
-        doc = processed_docs[0]
-        remote_path = f"test/{doc.id}.txt"
-        metadata = {
-            "source": doc.source,
-            "quality_score": doc.quality_score,
-            "token_count": doc.token_count
-        }
+        items = [
+            (
+                doc.text,
+                f"test/{doc.id}.txt",
+                {
+                    "source": doc.source,
+                    "quality_score": doc.quality_score,
+                    "token_count": doc.token_count
+                }
+            )
+            for doc in processed_docs
+        ]
         
-        # Store the document
-        result = local_storage.store_text(doc.text, remote_path, metadata)
-        assert result, "Failed to store document"
+        # Store the documents
+        results = local_storage.store_texts(items)
+        assert all(results.values()), "Failed to store document"
         
-        # Retrieve the document
+        # Compare digests of the stored files, computed concurrently, with
+        # digests of the original texts (written in text mode on Windows)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            stored_digests = list(executor.map(local_storage.get_digest, [remote_path for _, remote_path, _ in items]))
+            
+        for (text, _, _), stored_digest in zip(items, stored_digests):
+            if os.name == "nt":
+                text = text.replace("\n", os.linesep)
+            assert stored_digest == hashlib.sha256(text.encode("utf-8")).digest(), "Retrieved text doesn't match original"
+            
+        # Read one document back through get_text as well
+        text, remote_path, _ = items[0]
         retrieved_text = local_storage.get_text(remote_path)
-        assert retrieved_text == doc.text, "Retrieved text doesn't match original"
+        assert retrieved_text == text, "Retrieved text doesn't match original"
         
         # List files
         files = local_storage.list_files("test/")
         assert len(files) > 0, "No files listed"
         
-        logger.info(f"Successfully validated storage with {len(files)} files")
+        logger.info("Successfully validated storage with %d files", len(files))
         return True
     
     return False
 
 
-def validate_orchestration():
+def validate_orchestration(sample_file):
     """Validate the orchestration module."""
     logger.info("Validating orchestration module")
     
-    # Create sample data
-    sample_file = create_sample_data()
+    # Name the dataset version after the sample content, so runs over the
+    # same sample tag the same version
+    dataset_version = f"validation_{hashlib.sha256(sample_file.read_bytes()).hexdigest()[:12]}"
     
     try:
         # Run a small pipeline with the sample data
@@ -159,7 +232,7 @@ def validate_orchestration():
             text_field="text",
             id_field="id",
             limit=3,
-            dataset_version=f"validation_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            dataset_version=dataset_version
         )
         
         # Check results
@@ -168,15 +241,64 @@ def validate_orchestration():
         assert "processed_count" in results, "Missing processed_count in results"
         assert "storage_results" in results, "Missing storage_results in results"
         
-        logger.info(f"Successfully validated orchestration: {results}")
+        logger.info("Successfully validated orchestration: %s", results)
         return True
     except Exception as e:
-        logger.error(f"Orchestration validation failed: {e}")
+        logger.error("Orchestration validation failed: %s", e)
         return False
 
 
-def run_validation():
-    """Run all validation tests."""
+def validate_components(documents, validation_results):
+    """Validate data processing and storage of collected documents in order."""
+    # Validate data processing
+    processed_docs = validate_data_processing(documents)
+    validation_results["data_processing"] = bool(processed_docs)
+    
+    # Validate data storage
+    if validation_results["data_processing"]:
+        validation_results["data_storage"] = validate_data_storage(processed_docs)
+
+
+def compute_validation_key(sample_file):
+    """Hash everything a validation result depends on.
+    
+    This covers the sample data, the pipeline and validation source code,
+    and the environment variables in CACHE_ENV_VARS.
+    """
+    digest = hashlib.sha256(sample_file.read_bytes())
+    for source_file in sorted(SOURCE_DIR.rglob("*.py")):
+        digest.update(source_file.read_bytes())
+    digest.update(Path(__file__).read_bytes())
+    for name in CACHE_ENV_VARS:
+        digest.update(f"{name}={os.environ.get(name, '')}\n".encode("utf-8"))
+        
+    return digest.hexdigest()
+
+
+def load_validation_cache():
+    """Load the stages that passed in previous validation runs."""
+    try:
+        return json.loads(VALIDATION_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_validation_cache(cache):
+    """Save the stages that passed for later validation runs."""
+    VALIDATION_CACHE_FILE.write_text(json.dumps(cache, indent=2))
+
+
+def run_validation(incremental=False):
+    """Run all validation tests.
+    
+    Data collection is validated first. If it fails, the orchestration
+    validation, which collects the same sample, is not attempted. Otherwise
+    processing and storage are validated in a background thread while the
+    orchestration validation runs its own pipeline in the main thread.
+    
+    With incremental set, stages that already passed for the same sample
+    data, source code and configuration are skipped.
+    """
     logger.info("Starting pipeline validation")
     
     validation_results = {
@@ -187,21 +309,58 @@ def run_validation():
     }
     
     try:
-        # Validate data collection
-        documents = validate_data_collection()
-        validation_results["data_collection"] = bool(documents)
+        # Create sample data once for all stages
+        sample_file = create_sample_data()
         
-        # Validate data processing
-        if validation_results["data_collection"]:
-            processed_docs = validate_data_processing(documents)
-            validation_results["data_processing"] = bool(processed_docs)
+        # Find the stages that passed before with identical inputs
+        passed_stages = set()
+        if incremental:
+            validation_key = compute_validation_key(sample_file)
+            cache = load_validation_cache()
+            passed_stages = {
+                stage for stage, entry in cache.items()
+                if entry.get("hash") == validation_key and entry.get("ok")
+            }
+            for stage in sorted(passed_stages):
+                logger.info("Skipping %s validation, unchanged since it last passed", stage)
+                validation_results.update(dict.fromkeys(CACHED_STAGES[stage], True))
+                
+        # Load tokenizer models and other lazy resources once, before the
+        # component and orchestration validations process documents in two
+        # threads at the same time
+        if len(passed_stages) < len(CACHED_STAGES):
+            warm_up_pipeline()
             
-            # Validate data storage
-            if validation_results["data_processing"]:
-                validation_results["data_storage"] = validate_data_storage(processed_docs)
-        
-        # Validate orchestration
-        validation_results["orchestration"] = validate_orchestration()
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="validate-components") as executor:
+            components_future = None
+            if "components" not in passed_stages:
+                # Validate data collection
+                documents = validate_data_collection(sample_file)
+                validation_results["data_collection"] = bool(documents)
+                
+                # Validate processing and storage of the collected documents
+                if validation_results["data_collection"]:
+                    components_future = executor.submit(validate_components, documents, validation_results)
+                    
+            # Validate orchestration at the same time, unless it would fail
+            # to collect the sample anyway
+            if "orchestration" not in passed_stages and validation_results["data_collection"]:
+                validation_results["orchestration"] = validate_orchestration(sample_file)
+                
+            # Re-raise any component validation failure
+            if components_future is not None:
+                components_future.result()
+                
+        # Remember the stages that passed
+        if incremental:
+            for stage, components in CACHED_STAGES.items():
+                if all(validation_results[component] for component in components):
+                    cache[stage] = {
+                        "hash": validation_key,
+                        "ok": True,
+                        "ts": datetime.now(timezone.utc).isoformat()
+                    }
+            save_validation_cache(cache)
         
         # Overall validation result
         validation_success = all(validation_results.values())
@@ -210,15 +369,15 @@ def run_validation():
             logger.info("All validation tests passed!")
         else:
             failed_components = [comp for comp, result in validation_results.items() if not result]
-            logger.warning(f"Validation failed for components: {', '.join(failed_components)}")
+            logger.warning("Validation failed for components: %s", ", ".join(failed_components))
         
         return validation_success
     
     except Exception as e:
-        logger.exception(f"Validation failed with error: {e}")
+        logger.exception("Validation failed with error: %s", e)
         return False
 
 
 if __name__ == "__main__":
-    success = run_validation()
+    success = run_validation(incremental="--incremental" in sys.argv[1:])
     sys.exit(0 if success else 1)